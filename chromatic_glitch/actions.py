@@ -0,0 +1,11 @@
+# Defines the combat actions an input handler can return
+from enum import IntEnum
+
+class Action(IntEnum):
+    """Player choices during the combat turn. Used as keys into the treatment phase's handler table."""
+    PLAY_CARD = 0
+    USE_CONSUMABLE = 1
+    END_TURN = 2
+
+    def __str__(self):
+        return self.name.replace("_", " ").title() # "Play Card", "Use Consumable", "End Turn"
@@ -2,251 +2,320 @@
 # Import UI interfaces for type hinting
 from .ui.abstract_ui import AbstractRenderer
 # Import other types for hinting
-from .characters import PlayerCharacter
 from .tools import Tool # For type hinting player_tools
+from .effects import split_effect_key
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # Hint-only: a runtime import would cycle back through cards.py
+    from .characters import PlayerCharacter
 
 import random # Needed for base intent
+from enum import IntEnum
+
+class IntentAction(IntEnum):
+    """What an Ailment plans to do next turn. Stored in a slot instead of a per-turn (action, target) tuple."""
+    ATTACK = 1
+    IDLE = 2
+    CHARGE = 3
+
+    def __str__(self):
+        return self.name.title() # "Attack", "Idle", "Charge"
 
 class Ailment:
     """Represents an enemy Ailment in combat."""
+    __slots__ = ("name", "max_resonance", "current_resonance", "status_effects", "fragile_stacks", "slow_stacks", "intent_action", "intent_target", "position", "description")
+
+    # Intent announcements; only the name/target/counter are filled in per turn
+    INTENT_ATTACK_FMT = "{name} intends to Attack {target}."
+    INTENT_IDLE_FMT = "{name} has no valid targets and idles."
+
     def __init__(self, name, max_resonance, description=""):
         self.name = name
         self.max_resonance = max_resonance
         self.current_resonance = max_resonance
-        self.status_effects = {} # e.g., {"Fragile": 1}
-        self.intent = None # What the ailment plans to do next turn (e.g., "Attack", "Defend")
+        self.status_effects = {} # e.g., {"Fragile_1": 1}
+        self.fragile_stacks = 0 # Sum of active Fragile_X magnitudes, kept in sync with status_effects
+        self.slow_stacks = 0 # Number of active Slow effects; > 0 means the ailment acts last
+        self.intent_action = None # What the ailment plans to do next turn (an IntentAction)
+        self.intent_target = None # Tool targeted by the intent, if any
         self.position = 0 # Placeholder for positional logic
         self.description = description # Flavor text or type description
 
+    @property
+    def is_alive(self):
+        """True while the Ailment still has Resonance left."""
+        return self.current_resonance > 0
+
     # Modified to accept renderer
     def take_soothe(self, amount, renderer: AbstractRenderer):
         """Applies Soothe (damage) to the Ailment, considering Fragile."""
-        fragile_modifier = 1.0 # Default multiplier
-        fragile_stacks = 0
-        # Check for Fragile status (assuming format "Fragile_X")
-        for effect_key in list(self.status_effects.keys()): # Iterate over copy
-             if effect_key.startswith("Fragile_"):
-                  try:
-                       stacks = int(effect_key.split("_")[1])
-                       # Example: Each stack increases damage by 50%? TBD
-                       fragile_modifier += stacks * 0.5
-                       fragile_stacks = stacks # Store for message
-                       # Consume Fragile? Or let it tick down? Assume tick down for now.
-                  except (IndexError, ValueError):
-                       renderer.display_message(f"Error parsing Fragile effect: {effect_key}")
+        # Fragile stacks are parsed once in add_status_effect, not per hit
+        fragile_stacks = self.fragile_stacks
 
         actual_soothe = amount
         if fragile_stacks > 0:
+             # Example: Each stack increases damage by 50%? TBD
+             # Consume Fragile? Or let it tick down? Assume tick down for now.
+             fragile_modifier = 1.0 + fragile_stacks * 0.5
              actual_soothe = int(actual_soothe * fragile_modifier) # Apply multiplier
-             renderer.display_message(f"Fragile ({fragile_stacks}) increases Soothe taken!")
+             if renderer.enabled: renderer.display_message(f"Fragile ({fragile_stacks}) increases Soothe taken!")
 
         if actual_soothe < 0: actual_soothe = 0
 
         self.current_resonance -= actual_soothe
-        message = f"{self.name} takes {actual_soothe} Soothe."
         if self.current_resonance <= 0:
             self.current_resonance = 0
-            message += f" ({self.current_resonance}/{self.max_resonance} Res) - Soothed!"
+            if renderer.enabled: renderer.display_message(f"{self.name} takes {actual_soothe} Soothe. ({self.current_resonance}/{self.max_resonance} Res) - Soothed!")
         else:
-            message += f" ({self.current_resonance}/{self.max_resonance} Res remaining)."
-        renderer.display_message(message)
+            if renderer.enabled: renderer.display_message(f"{self.name} takes {actual_soothe} Soothe. ({self.current_resonance}/{self.max_resonance} Res remaining).")
         return self.current_resonance <= 0
 
     # Modified to accept renderer
     def add_status_effect(self, effect_name, duration, renderer: AbstractRenderer):
         """Adds a status effect."""
         # TODO: Handle stacking/refreshing logic
+        if effect_name not in self.status_effects: # Refreshing an effect doesn't add stacks
+            self._track_effect_stacks(effect_name, 1)
         self.status_effects[effect_name] = duration
-        renderer.display_message(f"{self.name} gains {effect_name} for {duration} turns.")
+        if renderer.enabled: renderer.display_message(f"{self.name} gains {effect_name} for {duration} turns.")
+
+    def clear_status_effects(self):
+        """Removes all status effects, resetting the stack counters that mirror them."""
+        self.status_effects.clear()
+        self.fragile_stacks = 0
+        self.slow_stacks = 0
+
+    def _track_effect_stacks(self, effect_name, sign):
+        """Updates the integer stack counters when an effect is added (+1) or removed (-1)."""
+        kind, magnitude = split_effect_key(effect_name)
+        if kind == "Fragile":
+            self.fragile_stacks += sign * magnitude
+        elif kind == "Slow":
+            self.slow_stacks += sign
 
     # Modified to accept game_state (for renderer access)
     def determine_intent(self, player_tools: list[Tool], game_state):
         """Determines the Ailment's action for the next turn."""
         renderer = game_state.renderer # Get renderer from game_state
-        # Placeholder: Always intends to attack the first tool
+        # Attack a random valid tool: single-pass reservoir sample (k=1), no temp list
         target = None
-        valid_targets = [t for t in player_tools if t.current_resonance > 0]
-        if valid_targets:
-            target = random.choice(valid_targets) # Attack random valid tool
+        valid_count = 0
+        for tool in player_tools:
+            if tool.current_resonance > 0:
+                valid_count += 1
+                if random.random() * valid_count < 1.0: # Keep with probability 1/valid_count
+                    target = tool
 
         if target:
-            self.intent = ("Attack", target)
-            renderer.display_message(f"{self.name} intends to Attack {target.name}.")
+            self.intent_action = IntentAction.ATTACK
+            self.intent_target = target
+            if renderer.enabled: renderer.display_message(self.INTENT_ATTACK_FMT.format(name=self.name, target=target.name))
         else:
-            self.intent = ("Idle", None)
-            renderer.display_message(f"{self.name} has no valid targets and idles.")
+            self.intent_action = IntentAction.IDLE
+            self.intent_target = None
+            if renderer.enabled: renderer.display_message(self.INTENT_IDLE_FMT.format(name=self.name))
         # TODO: Implement more complex AI/intent logic based on ailment type
 
     # Accepts game_state for renderer access
-    def act(self, player_character: PlayerCharacter, game_state):
-        """Executes the Ailment's action based on its intent."""
+    def act(self, player_character: 'PlayerCharacter', game_state):
+        """Executes the Ailment's action based on its intent. Returns True if the action broke a Tool."""
         renderer = game_state.renderer # Get renderer
+        broke_tool = False
         # renderer.display_message(f"\n--- {self.name}'s Turn ---") # Maybe redundant if phase handler announces turn
-        if not self.intent:
-            renderer.display_message(f"{self.name} has no intent and does nothing.")
-            return
+        if not self.intent_action:
+            if renderer.enabled: renderer.display_message(f"{self.name} has no intent and does nothing.")
+            return False
 
-        action_type, target = self.intent
-        if action_type == "Attack":
+        action_type = self.intent_action
+        target = self.intent_target
+        if action_type == IntentAction.ATTACK:
             if target and target.current_resonance > 0:
                 damage = 5 # Basic damage value
-                renderer.display_message(f"{self.name} attacks {target.name}!")
+                if renderer.enabled: renderer.display_message(f"{self.name} attacks {target.name}!")
                 # Pass renderer to take_damage
-                target.take_damage(damage, renderer)
+                broke_tool = target.take_damage(damage, renderer)
             else:
-                renderer.display_message(f"{self.name} tries to attack, but the target is invalid or broken.")
+                if renderer.enabled: renderer.display_message(f"{self.name} tries to attack, but the target is invalid or broken.")
         # TODO: Implement other actions (Defend, Buff, Debuff)
         else:
-            renderer.display_message(f"{self.name} performs unknown action: {action_type}")
+            if renderer.enabled: renderer.display_message(f"{self.name} performs unknown action: {action_type}")
 
         # Clear intent after acting
-        self.intent = None
+        self.intent_action = None
+        self.intent_target = None
         # Pass renderer to tick_status_effects
         self.tick_status_effects(renderer) # Tick effects after acting
+        return broke_tool
 
     # Modified to accept renderer
     def tick_status_effects(self, renderer: AbstractRenderer):
         """Processes status effects at the start/end of a turn. Decrements duration."""
-        expired_effects = []
+        status_effects = self.status_effects
         # renderer.display_message(f"Ticking status effects for {self.name}:") # Optional verbosity
-        if not self.status_effects:
+        if not status_effects:
             # renderer.display_message("  No active effects.")
             return
 
-        for effect, duration in list(self.status_effects.items()): # Use list() for safe iteration
+        # Single pass over a snapshot of the keys; expired effects are deleted in place
+        for effect in tuple(status_effects):
             # TODO: Apply actual effect logic here (e.g., Fragile increasing damage taken)
+            duration = status_effects[effect]
             if duration > 0:
-                self.status_effects[effect] -= 1
+                duration -= 1
                 # Optionally display tick down?
-                # renderer.display_message(f"  {effect} on {self.name}: {self.status_effects[effect]} turns remaining.")
-                if self.status_effects[effect] == 0:
-                    expired_effects.append(effect)
-
-        for effect in expired_effects:
-            renderer.display_message(f"  {effect} on {self.name} has expired.")
-            del self.status_effects[effect]
+                # renderer.display_message(f"  {effect} on {self.name}: {duration} turns remaining.")
+                if duration == 0:
+                    del status_effects[effect]
+                    self._track_effect_stacks(effect, -1)
+                    if renderer.enabled: renderer.display_message(f"  {effect} on {self.name} has expired.")
+                else:
+                    status_effects[effect] = duration
 
     def __str__(self):
         # Basic representation
         status_str = ", ".join([f"{k}:{v}t" for k, v in self.status_effects.items()])
-        intent_str = f"Intent: {self.intent[0]} {self.intent[1].name}" if self.intent and self.intent[1] else "Intent: None"
+        target = self.intent_target
+        intent_str = f"Intent: {self.intent_action} {target.name}" if target else "Intent: None"
         return f"[{self.name} ({self.current_resonance}/{self.max_resonance} Res) Status: {status_str if status_str else 'None'} | {intent_str}]"
 
 
 # --- Specific Ailment Definitions ---
 
 class CrawlingAnxiety(Ailment):
+    __slots__ = ()
+    base_damage = 3 # Example damage value; shared by every instance
+
     def __init__(self):
         super().__init__(name="Crawling Anxiety", max_resonance=15, description="Low health, attacks frequently for small damage.")
-        self.base_damage = 3 # Example damage value
 
     # Modified to accept game_state for renderer access
     def determine_intent(self, player_tools: list[Tool], game_state):
         """Crawling Anxiety always tries to attack the tool with the lowest current resonance."""
         renderer = game_state.renderer # Get renderer
+        # Find the tool with the lowest current health that is not broken (filter + min in one pass)
         target = None
-        if player_tools:
-            # Find the tool with the lowest current health that is not broken
-            valid_targets = [t for t in player_tools if t.current_resonance > 0]
-            if valid_targets:
-                target = min(valid_targets, key=lambda tool: tool.current_resonance)
-
-        # determine_intent should use renderer now
-        renderer = game_state.renderer # Need game_state passed here? Or just renderer? Let's assume renderer for now.
+        lowest_resonance = float('inf')
+        for tool in player_tools:
+            resonance = tool.current_resonance
+            if 0 < resonance < lowest_resonance:
+                target = tool
+                lowest_resonance = resonance
+
         if target:
-            self.intent = ("Attack", target)
-            renderer.display_message(f"{self.name} intends to Attack {target.name}.")
+            self.intent_action = IntentAction.ATTACK
+            self.intent_target = target
+            if renderer.enabled: renderer.display_message(self.INTENT_ATTACK_FMT.format(name=self.name, target=target.name))
         else:
-            self.intent = ("Idle", None) # No valid targets
-            renderer.display_message(f"{self.name} has no valid targets and idles.")
+            self.intent_action = IntentAction.IDLE
+            self.intent_target = None # No valid targets
+            if renderer.enabled: renderer.display_message(self.INTENT_IDLE_FMT.format(name=self.name))
 
     # Accepts game_state for renderer access
-    def act(self, player_character: PlayerCharacter, game_state):
-        """Executes the Ailment's action based on its intent."""
+    def act(self, player_character: 'PlayerCharacter', game_state):
+        """Executes the Ailment's action based on its intent. Returns True if the action broke a Tool."""
         renderer = game_state.renderer
+        broke_tool = False
         # renderer.display_message(f"\n--- {self.name}'s Turn ---") # Redundant?
-        if not self.intent or self.intent[0] == "Idle":
-            renderer.display_message(f"{self.name} idles.")
-            self.intent = None
+        if not self.intent_action or self.intent_action == IntentAction.IDLE:
+            if renderer.enabled: renderer.display_message(f"{self.name} idles.")
+            self.intent_action = None
+            self.intent_target = None
             self.tick_status_effects(renderer) # Still tick effects even if idle
-            return
+            return False
 
-        action_type, target = self.intent
-        if action_type == "Attack":
+        action_type = self.intent_action
+        target = self.intent_target
+        if action_type == IntentAction.ATTACK:
             if target and target.current_resonance > 0:
-                renderer.display_message(f"{self.name} attacks {target.name}!")
-                target.take_damage(self.base_damage, renderer) # Pass renderer
+                if renderer.enabled: renderer.display_message(f"{self.name} attacks {target.name}!")
+                broke_tool = target.take_damage(self.base_damage, renderer) # Pass renderer
                 # TODO: Add 'Jittery' debuff application
             else:
-                renderer.display_message(f"{self.name} tries to attack, but the target is invalid or broken.")
+                if renderer.enabled: renderer.display_message(f"{self.name} tries to attack, but the target is invalid or broken.")
         else:
-            renderer.display_message(f"{self.name} performs unknown action: {action_type}")
+            if renderer.enabled: renderer.display_message(f"{self.name} performs unknown action: {action_type}")
 
         # Clear intent after acting
-        self.intent = None
+        self.intent_action = None
+        self.intent_target = None
         self.tick_status_effects(renderer) # Tick effects after acting
+        return broke_tool
 
 
 class SensorySpike(Ailment):
+    __slots__ = ("charge_turns",)
+    max_charge = 2 # Turns needed to charge fully
+    attack_damage = 15 # Damage when attack fires
+
+    INTENT_ATTACK_FMT = "{name} intends to unleash a Sensory Spike on {target}!"
+    INTENT_CHARGE_FMT = "{name} is gathering energy ({turn}/{max_charge})..."
+
     def __init__(self):
         super().__init__(name="Sensory Spike", max_resonance=30, description="Charges up a powerful attack. Vulnerable while charging.")
         self.charge_turns = 0 # How many turns spent charging
-        self.max_charge = 2 # Turns needed to charge fully
-        self.attack_damage = 15 # Damage when attack fires
 
     # Modified to accept game_state for renderer access
     def determine_intent(self, player_tools: list[Tool], game_state):
         """Charges up, then attacks."""
         renderer = game_state.renderer # Get renderer
         if self.charge_turns < self.max_charge:
-            self.intent = ("Charge", None)
-            renderer.display_message(f"{self.name} is gathering energy ({self.charge_turns + 1}/{self.max_charge})...")
+            self.intent_action = IntentAction.CHARGE
+            self.intent_target = None
+            if renderer.enabled: renderer.display_message(self.INTENT_CHARGE_FMT.format(name=self.name, turn=self.charge_turns + 1, max_charge=self.max_charge))
         else:
-            # Attack the tool with the highest current resonance
+            # Attack the tool with the highest current resonance (broken tools never beat 0)
             target = None
-            if player_tools:
-                valid_targets = [t for t in player_tools if t.current_resonance > 0]
-                if valid_targets:
-                    target = max(valid_targets, key=lambda tool: tool.current_resonance)
+            highest_resonance = 0
+            for tool in player_tools:
+                resonance = tool.current_resonance
+                if resonance > highest_resonance:
+                    target = tool
+                    highest_resonance = resonance
 
             if target:
-                self.intent = ("Attack", target)
-                renderer.display_message(f"{self.name} intends to unleash a Sensory Spike on {target.name}!")
+                self.intent_action = IntentAction.ATTACK
+                self.intent_target = target
+                if renderer.enabled: renderer.display_message(self.INTENT_ATTACK_FMT.format(name=self.name, target=target.name))
             else:
-                self.intent = ("Idle", None)
-                renderer.display_message(f"{self.name} has no valid targets and idles.")
+                self.intent_action = IntentAction.IDLE
+                self.intent_target = None
+                if renderer.enabled: renderer.display_message(self.INTENT_IDLE_FMT.format(name=self.name))
 
     # Accepts game_state for renderer access
-    def act(self, player_character: PlayerCharacter, game_state):
-        """Executes the Ailment's action based on its intent."""
+    def act(self, player_character: 'PlayerCharacter', game_state):
+        """Executes the Ailment's action based on its intent. Returns True if the action broke a Tool."""
         renderer = game_state.renderer
+        broke_tool = False
         # renderer.display_message(f"\n--- {self.name}'s Turn ---") # Redundant?
-        if not self.intent:
-            renderer.display_message(f"{self.name} has no intent and does nothing.")
+        if not self.intent_action:
+            if renderer.enabled: renderer.display_message(f"{self.name} has no intent and does nothing.")
             self.tick_status_effects(renderer) # Still tick effects
-            return
+            return False
 
-        action_type, target = self.intent
-        if action_type == "Charge":
+        action_type = self.intent_action
+        target = self.intent_target
+        if action_type == IntentAction.CHARGE:
             self.charge_turns += 1
-            renderer.display_message(f"{self.name} continues charging...")
+            if renderer.enabled: renderer.display_message(f"{self.name} continues charging...")
             # TODO: Apply 'Vulnerable' status while charging?
-        elif action_type == "Attack":
+        elif action_type == IntentAction.ATTACK:
             if target and target.current_resonance > 0:
-                renderer.display_message(f"{self.name} unleashes its attack on {target.name}!")
-                target.take_damage(self.attack_damage, renderer) # Pass renderer
+                if renderer.enabled: renderer.display_message(f"{self.name} unleashes its attack on {target.name}!")
+                broke_tool = target.take_damage(self.attack_damage, renderer) # Pass renderer
                 self.charge_turns = 0 # Reset charge after attacking
             else:
-                renderer.display_message(f"{self.name} tries to attack, but the target is invalid or broken.")
+                if renderer.enabled: renderer.display_message(f"{self.name} tries to attack, but the target is invalid or broken.")
                 self.charge_turns = 0 # Reset charge even if attack fails? TBD
-        elif action_type == "Idle":
-             renderer.display_message(f"{self.name} idles.")
+        elif action_type == IntentAction.IDLE:
+             if renderer.enabled: renderer.display_message(f"{self.name} idles.")
              self.charge_turns = 0 # Reset charge if idling? TBD
         else:
-            renderer.display_message(f"{self.name} performs unknown action: {action_type}")
+            if renderer.enabled: renderer.display_message(f"{self.name} performs unknown action: {action_type}")
 
         # Clear intent after acting
-        self.intent = None
+        self.intent_action = None
+        self.intent_target = None
         self.tick_status_effects(renderer) # Tick effects after acting
+        return broke_tool
 
 # TODO: Define Fragmented Thought, Deepening Shadow, etc.
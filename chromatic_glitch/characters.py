@@ -2,7 +2,8 @@
 
 # Import specific components needed
 from .cards import (
-    Card, Strike, Guard, ForcefulNote, SteadyRhythm, EchoingShout, KaelensResolve, # Kaelen
+    Card, card, # Shared-instance factory for deck building
+    Strike, Guard, ForcefulNote, SteadyRhythm, EchoingShout, KaelensResolve, # Kaelen
     Soothe, Mend, FlowingChord, EntanglingTune, HarmonicPulse, LyrasInsight # Lyra
 )
 # Import concrete types needed for instantiation here
@@ -18,12 +19,22 @@ if TYPE_CHECKING:
     from .ui.abstract_ui import AbstractRenderer, AbstractInputHandler
 
 import random
+from collections import Counter, deque
 # Remove imports that are now at the top
 # from .dice import Die, ObsidianFocusDie, RiverPearlDie
 # from .tools import Tool, ResonantGourd, SteadyDrum, TunedPanpipes
 
 class PlayerCharacter:
     """Represents the player character."""
+    __slots__ = (
+        "name", "archetype",
+        "deck", "hand", "discard_pile", "card_collection", "enhanceable_cards",
+        "dice_collection", "dice_loadout", "dice_score_bonus",
+        "tools", "max_tools", "max_equipment_slots", "equipment", "item_collection", "item_by_name", "consumables",
+        "currency", "max_ap", "current_ap",
+        "status_effects", "next_combat_start_effects", "next_turn_effects",
+    )
+
     # __init__ doesn't need UI handlers directly, they are accessed via game_state
     def __init__(self, name, archetype, starting_deck, starting_die, starting_tools, starting_currency=50):
         self.name = name
@@ -32,13 +43,17 @@ class PlayerCharacter:
         # Core Gameplay Elements
         self.deck = list(starting_deck) # Current deck for combat
         self.hand = []
-        self.discard_pile = []
+        self.discard_pile = deque() # Only appended to and emptied back into the deck
         self.card_collection = list(starting_deck) # All owned cards
+        # Owned cards not yet enhanced, kept in step by add_card/enhance_card so the shop needn't rescan
+        self.enhanceable_cards = [c for c in self.card_collection if not c.name.endswith("+")]
 
         # Collection holds all owned dice initially
-        self.dice_collection: list['Die'] = [starting_die] + [Die("Standard Die") for _ in range(5)]
+        # Standard dice hold no state, so the five slots share one instance
+        self.dice_collection: list['Die'] = [starting_die] + [Die("Standard Die")] * 5
         # Loadout is the first 6 dice equipped (ensure distinct objects if needed later)
         self.dice_loadout: list['Die'] = list(self.dice_collection[:6]) # Ensure loadout has exactly 6 dice initially
+        self.dice_score_bonus = 0 # Starting points for each dice game, granted by equipment
 
         self.tools: list['Tool'] = list(starting_tools) # Type hint list of Tool
         self.max_tools = len(starting_tools)
@@ -46,7 +61,8 @@ class PlayerCharacter:
         self.max_equipment_slots = 5 # From design doc
         self.equipment: list['Equipment' | None] = [None] * self.max_equipment_slots # Type hint list of optional Equipment
         self.item_collection: list[Any] = [] # Holds Equipment and Consumable objects, use Any for simplicity or Union
-        self.consumables: dict[str, int] = {} # Type hint dictionary
+        self.item_by_name: dict[str, Any] = {} # Consumable name -> the one object used for all of them; see add_consumable
+        self.consumables: Counter[str] = Counter() # Consumable name -> count
 
         # Stats & Resources
         self.currency = starting_currency
@@ -56,7 +72,7 @@ class PlayerCharacter:
         # Status Effects (applied to the character directly, if any)
         self.status_effects = {} # e.g., {"Focus": 2} turns remaining
         # Effects applied at the start of the next combat
-        self.next_combat_start_effects = {} # e.g., {"Distracted": 1}
+        self.next_combat_start_effects = {} # StartEffect -> value, e.g., {StartEffect.DISTRACTED: 1}
         # Effects applied at the start of the next turn
         self.next_turn_effects = {} # e.g., {"BonusAP": 1}
 
@@ -67,41 +83,66 @@ class PlayerCharacter:
     def draw_card(self, amount: int, renderer: 'AbstractRenderer'): # Use string hint
         """Draws cards from the deck to the hand."""
         drawn_cards: list[Card] = [] # Type hint list of Card
+        # The piles are only mutated in place below, so local names stay valid for the whole loop
+        deck, hand, discard = self.deck, self.hand, self.discard_pile
         for _ in range(amount):
-            if not self.deck:
-                if not self.discard_pile:
-                    renderer.display_message("Deck and discard pile are empty!")
+            if not deck:
+                if not discard:
+                    if renderer.enabled: renderer.display_message("Deck and discard pile are empty!")
                     break
-                renderer.display_message("Deck empty. Shuffling discard pile...")
-                random.shuffle(self.discard_pile)
-                self.deck.extend(self.discard_pile)
-                self.discard_pile = []
+                if renderer.enabled: renderer.display_message("Deck empty. Shuffling discard pile...")
+                # Deck is empty: refill it in place and shuffle the list (random.shuffle wants a list)
+                deck.extend(discard)
+                discard.clear()
+                random.shuffle(deck)
 
-            drawn_card = self.deck.pop()
-            self.hand.append(drawn_card)
+            drawn_card = deck.pop()
+            hand.append(drawn_card)
             drawn_cards.append(drawn_card)
-        if drawn_cards:
+        if drawn_cards and renderer.enabled:
              # Renderer can decide how verbose to be
-             renderer.display_message(f"Drew {len(drawn_cards)} card(s). Hand size: {len(self.hand)}")
+             renderer.display_message(f"Drew {len(drawn_cards)} card(s). Hand size: {len(hand)}")
         return drawn_cards
 
     # Modified to accept renderer
     def shuffle_deck(self, renderer: 'AbstractRenderer'): # Use string hint
         """Shuffles the deck."""
-        renderer.display_message("Shuffling deck...")
+        if renderer.enabled: renderer.display_message("Shuffling deck...")
         random.shuffle(self.deck)
 
+    def add_card(self, new_card):
+        """Adds a card to the collection, indexing it as enhanceable if it isn't already enhanced."""
+        self.card_collection.append(new_card)
+        if not new_card.name.endswith("+"):
+            self.enhanceable_cards.append(new_card)
+
+    def enhance_card(self, card_to_enhance, renderer: 'AbstractRenderer'): # Use string hint
+        """Replaces an owned card with an enhanced copy. Returns the copy, or None if it couldn't be enhanced."""
+        # Copy rather than enhance in place: basic cards are shared between decks
+        enhanced_card = card_to_enhance.enhanced_copy(renderer)
+        if enhanced_card is not None:
+            self.card_collection[self.card_collection.index(card_to_enhance)] = enhanced_card
+            self.enhanceable_cards.remove(card_to_enhance)
+        return enhanced_card
+
+    def add_consumable(self, item: 'Consumable'):
+        """Adds one use of a Consumable. The first object of each name is kept and looked up by name from then on."""
+        self.consumables[item.name] += 1
+        if self.item_by_name.setdefault(item.name, item) is item:
+            self.item_collection.append(item)
+
     # Modified to accept renderer
     def start_combat(self, renderer: 'AbstractRenderer'): # Use string hint
         """Resets state for the start of combat."""
-        renderer.display_message("Preparing for combat...")
-        self.deck = list(self.card_collection)
-        self.hand = []
-        self.discard_pile = []
+        if renderer.enabled: renderer.display_message("Preparing for combat...")
+        # Refill the existing lists in place rather than allocating new ones each combat
+        self.deck[:] = self.card_collection
+        self.hand.clear()
+        self.discard_pile.clear()
         self.shuffle_deck(renderer) # Pass renderer
         # Reset tool health? Or does it persist between combats? Assuming persist for now.
         # Reset player status effects? TBD - Keep persistent ones? Clear combat ones?
-        self.status_effects = {}
+        self.status_effects.clear()
         # Clear next combat effects AFTER applying them (handled in treatment phase start)
         # self.next_combat_start_effects = {} # Don't clear here
         # Apply equipment effects at start of combat? Or are they always active? Assume always active for now.
@@ -111,10 +152,10 @@ class PlayerCharacter:
         """Equips an item into a specific slot, handling unequip of previous item."""
         # isinstance check works with the actual class, no change needed here
         if not isinstance(item_to_equip, Equipment):
-            renderer.display_message(f"Error: Cannot equip {item_to_equip.name}, it's not Equipment.")
+            if renderer.enabled: renderer.display_message(f"Error: Cannot equip {item_to_equip.name}, it's not Equipment.")
             return False
         if not (0 <= slot_index < self.max_equipment_slots):
-            renderer.display_message(f"Error: Invalid equipment slot index {slot_index}.")
+            if renderer.enabled: renderer.display_message(f"Error: Invalid equipment slot index {slot_index}.")
             return False
 
         # Unequip item currently in slot, if any
@@ -132,7 +173,7 @@ class PlayerCharacter:
     def unequip_item(self, slot_index: int, renderer: 'AbstractRenderer'): # Use string hint
         """Unequips an item from a specific slot."""
         if not (0 <= slot_index < self.max_equipment_slots):
-            renderer.display_message(f"Error: Invalid equipment slot index {slot_index}.")
+            if renderer.enabled: renderer.display_message(f"Error: Invalid equipment slot index {slot_index}.")
             return False
 
         equipped_item = self.equipment[slot_index]
@@ -151,39 +192,40 @@ class PlayerCharacter:
         # Apply next turn effects first
         bonus_ap = self.next_turn_effects.get("BonusAP", 0)
         self.current_ap = self.max_ap + bonus_ap
-        if bonus_ap > 0:
+        if bonus_ap > 0 and renderer.enabled:
             renderer.display_message(f"Gained {bonus_ap} bonus AP this turn!")
-        # Clear effects after applying
-        self.next_turn_effects = {}
+        # Clear effects after applying (in place; the dict is reused every turn)
+        self.next_turn_effects.clear()
 
         # TODO: Handle status effect ticks (positive/negative) on player?
-        renderer.display_message(f"\n--- {self.name}'s Turn ---")
-        renderer.display_message(f"AP: {self.current_ap}/{self.max_ap}")
+        if renderer.enabled:
+            renderer.display_message(f"\n--- {self.name}'s Turn ---")
+            renderer.display_message(f"AP: {self.current_ap}/{self.max_ap}")
 
     # Modified to accept renderer
     def end_turn(self, renderer: 'AbstractRenderer'): # Use string hint
         """Actions to perform at the end of the player's turn."""
         # TODO: Discard remaining hand? (Depends on game rules)
         # TODO: Handle end-of-turn status effects
-        renderer.display_message(f"--- End {self.name}'s Turn ---")
+        if renderer.enabled: renderer.display_message(f"--- End {self.name}'s Turn ---")
 
 
-# TODO: Define specific character archetypes (Kaelen, Lyra) with their starting data
-# Example (needs actual Card, Die, Tool objects defined first):
-# Kaelen_Start_Deck = [Strike(), Strike(), ...]
-# Kaelen_Start_Die = ObsidianFocusDie()
 # --- Character Archetype Definitions ---
 
+# Starting decks are built once at import; PlayerCharacter copies the references.
+# Cards are shared instances; see cards.card and Card.enhanced_copy
+_KAELEN_DECK = (
+    (card(Strike),) * 4 + (card(Guard),) * 2 +
+    (card(ForcefulNote), card(SteadyRhythm), card(EchoingShout), card(KaelensResolve))
+)
+_LYRA_DECK = (
+    (card(Soothe),) * 3 + (card(Mend),) * 3 +
+    (card(FlowingChord), card(EntanglingTune), card(HarmonicPulse), card(LyrasInsight))
+)
+
 def get_kaelen_data():
     """Returns the starting data dictionary for Kaelen."""
-    starting_deck = [
-        Strike(), Strike(), Strike(), Strike(),
-        Guard(), Guard(),
-        ForcefulNote(),
-        SteadyRhythm(),
-        EchoingShout(),
-        KaelensResolve()
-    ]
+    starting_deck = _KAELEN_DECK
     starting_die = ObsidianFocusDie()
     # Example starting tools - can be adjusted
     starting_tools = [ResonantGourd(), SteadyDrum()]
@@ -198,14 +240,7 @@ def get_kaelen_data():
 
 def get_lyra_data():
     """Returns the starting data dictionary for Lyra."""
-    starting_deck = [
-        Soothe(), Soothe(), Soothe(),
-        Mend(), Mend(), Mend(),
-        FlowingChord(),
-        EntanglingTune(),
-        HarmonicPulse(),
-        LyrasInsight()
-    ]
+    starting_deck = _LYRA_DECK
     starting_die = RiverPearlDie()
     # Example starting tools - can be adjusted
     starting_tools = [ResonantGourd(), TunedPanpipes()] # Using Gourd and Panpipes
@@ -1,6 +1,8 @@
 # Defines Dice and the Dice Resonance Game logic
 
 import random
+from collections import Counter, defaultdict
+from functools import lru_cache
 # Import UI interfaces for type hinting
 from .ui.abstract_ui import AbstractRenderer, AbstractInputHandler
 # Import other types for hinting using forward references (strings)
@@ -9,8 +11,12 @@ if TYPE_CHECKING:
     from .characters import PlayerCharacter
 # from .dice import ObsidianFocusDie # No longer needed here, used below
 
+_D6_FACES = (1, 2, 3, 4, 5, 6) # Faces for the batched roll in DiceGame._roll_dice
+
 class Die:
     """Base class for dice."""
+    __slots__ = ("name", "description", "sides")
+
     def __init__(self, name, description="A standard six-sided die."):
         self.name = name
         self.description = description
@@ -32,6 +38,8 @@ class Die:
 
 class ObsidianFocusDie(Die):
     """Kaelen's starting die."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Obsidian Focus Die", description="When setting aside dice, you may re-roll one '2' or '3' once per round.")
 
@@ -40,6 +48,8 @@ class ObsidianFocusDie(Die):
 
 class RiverPearlDie(Die):
     """Lyra's starting die."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="River Pearl Die", description="Counts '5's as 60 points instead of 50.")
 
@@ -65,70 +75,54 @@ TRIPLE_SCORES = {
     6: 600,
 }
 STRAIGHT_SCORE = 1500
+_STRAIGHT = (1, 2, 3, 4, 5, 6) # Sorted values of a straight roll
+# Single-die combos by River Pearl presence, built once rather than per call
+_SINGLE_COMBOS = {
+    False: (((1,), SCORE_MAP[1], "Single 1"), ((5,), SCORE_MAP[5], "Single 5")),
+    True: (((1,), SCORE_MAP[1], "Single 1"), ((5,), 60, "Single 5 (River Pearl)")),
+}
 
-def calculate_score(dice_values, dice_objects=None):
+def calculate_score(dice_values, dice_objects=None, river_pearl=False):
     """
     Calculates the score for a given set of dice values.
     Returns a list of valid scoring combinations (value_list, score, description).
     Handles basic KCD scoring rules.
     `dice_objects` can be provided to handle special dice effects (e.g., River Pearl).
+    Callers that already know the loadout can pass `river_pearl` instead.
     """
-    scores = []
-    counts = {i: dice_values.count(i) for i in range(1, 7)}
-    remaining_dice = list(dice_values) # Copy to modify
+    river_pearl = river_pearl or any(isinstance(d, RiverPearlDie) for d in (dice_objects or []))
+    # Scoring ignores dice order, so the sorted values are a complete cache key
+    return list(_score_combinations(tuple(sorted(dice_values)), river_pearl))
 
-    # Check for Straight 1-6
-    if all(counts[i] >= 1 for i in range(1, 7)) and len(remaining_dice) == 6:
-        scores.append(((1, 2, 3, 4, 5, 6), STRAIGHT_SCORE, "Straight 1-6"))
-        return scores # Straight is exclusive
+@lru_cache(maxsize=2048) # Only 924 multisets of up to six d6 values, times two for River Pearl
+def _score_combinations(dice_values, river_pearl):
+    """Cached core of calculate_score. Takes a sorted tuple and returns a tuple of combos."""
+    # Check for Straight 1-6; the values arrive sorted, so this is one tuple compare
+    if dice_values == _STRAIGHT:
+        return (((1, 2, 3, 4, 5, 6), STRAIGHT_SCORE, "Straight 1-6"),) # Straight is exclusive
 
+    counts = Counter(dice_values) # One pass; triples and singles are taken off the counts
+
+    scores = []
     # Check for Triples
-    triples_found = []
-    temp_remaining_dice = list(remaining_dice) # Work on a copy for triple checking
     for value, score in TRIPLE_SCORES.items():
         if counts[value] >= 3:
-            triples_found.append((tuple([value]*3), score, f"Triple {value}s"))
-            # Remove three instances of the value from temp_remaining_dice
-            removed_count = 0
-            new_temp_remaining = []
-            for die in temp_remaining_dice:
-                if die == value and removed_count < 3:
-                    removed_count += 1
-                else:
-                    new_temp_remaining.append(die)
-            temp_remaining_dice = new_temp_remaining
-
-    scores.extend(triples_found)
-    remaining_dice = temp_remaining_dice # Update remaining_dice after finding all triples
+            scores.append(((value,) * 3, score, f"Triple {value}s"))
+            counts[value] -= 3 # Those three can't also score as singles
 
     # Check for Single 1s and 5s from the *remaining* dice
-    singles_found = []
-    is_river_pearl_present = any(isinstance(d, RiverPearlDie) for d in (dice_objects or []))
-
-    for die_value in remaining_dice: # Iterate through values directly
-        score_value = 0
-        desc = ""
-        if die_value == 1:
-            score_value = SCORE_MAP[1]
-            desc = "Single 1"
-        elif die_value == 5:
-            if is_river_pearl_present: # Simplified check
-                 score_value = 60
-                 desc = "Single 5 (River Pearl)"
-            else:
-                 score_value = SCORE_MAP[5]
-                 desc = "Single 5"
-
-        if score_value > 0:
-            # Represent single die combo as a tuple containing one element
-            singles_found.append(((die_value,), score_value, desc))
-
-    scores.extend(singles_found)
-    return scores
-
+    for combo in _SINGLE_COMBOS[river_pearl]:
+        scores.extend([combo] * counts[combo[0][0]])
+    return tuple(scores)
 
 class DiceGame:
     """Manages the Dice Resonance game mechanics."""
+    __slots__ = (
+        "player", "dice_loadout", "current_dice_objects", "current_roll_values",
+        "round_banked_score", "total_score", "current_round", "can_reroll_special",
+        "has_river_pearl", "has_obsidian_focus",
+    )
+
     # Use string hint for PlayerCharacter to break cycle
     def __init__(self, player: 'PlayerCharacter'):
         self.player = player
@@ -139,12 +133,15 @@ class DiceGame:
         self.total_score = 0
         self.current_round = 1
         self.can_reroll_special = True
+        # Special dice only matter by presence, and the loadout is fixed for the game
+        self.has_river_pearl = any(isinstance(d, RiverPearlDie) for d in self.dice_loadout)
+        self.has_obsidian_focus = any(isinstance(d, ObsidianFocusDie) for d in self.dice_loadout)
 
     # Modified to accept UI handlers
     def play_game(self, renderer: AbstractRenderer, input_handler: AbstractInputHandler) -> int:
         """Plays the two rounds of the dice game."""
         renderer.display_message("\n--- Dice Resonance Game ---")
-        start_bonus = getattr(self.player, 'dice_score_bonus', 0)
+        start_bonus = self.player.dice_score_bonus
         if start_bonus > 0:
             renderer.display_message(f"Applying starting bonus: +{start_bonus} points!")
         self.total_score = start_bonus
@@ -172,8 +169,12 @@ class DiceGame:
     def _roll_dice(self, dice_objects_to_roll: list[Die], renderer: AbstractRenderer):
         """Rolls the specified dice objects and updates internal state."""
         self.current_dice_objects = dice_objects_to_roll
-        self.current_roll_values = [die.roll() for die in self.current_dice_objects]
-        renderer.display_dice_roll(self.current_roll_values) # Use renderer
+        if all(type(die).roll is Die.roll and die.sides == 6 for die in dice_objects_to_roll):
+            # Plain d6s: one C-level call instead of a randint per die
+            self.current_roll_values = random.choices(_D6_FACES, k=len(dice_objects_to_roll))
+        else:
+            self.current_roll_values = [die.roll() for die in dice_objects_to_roll]
+        if renderer.enabled: renderer.display_dice_roll(self.current_roll_values) # Skip the call for discarding renderers
 
     # Modified to accept UI handlers
     def _play_round(self, renderer: AbstractRenderer, input_handler: AbstractInputHandler) -> int:
@@ -187,30 +188,24 @@ class DiceGame:
             roll_values = self.current_roll_values
             roll_objects = self.current_dice_objects
 
-            initial_possible_scores = calculate_score(roll_values, roll_objects)
-            # Original bust check location - keep it here for now
-            # Original bust check location - keep it here for now
-            # if not initial_possible_scores:
-            #     renderer.display_message("No scoring dice! Busted this round.")
-            #     return 0
+            # Scoring (and bust detection) happens once per pass of the selection loop below;
+            # its first pass sees the full roll, so there is no separate up-front evaluation
 
-            chosen_indices_this_roll = set()
+            chosen_mask = 0 # Bit i set once roll position i has been set aside
             current_selection_score = 0
             trigger_outer_loop_restart = False
 
             while True: # Inner loop for selecting dice from the current roll
                 renderer.display_message("\nCurrent Roll:",) # Use renderer
-                available_indices_in_roll = [i for i in range(len(roll_values)) if i not in chosen_indices_this_roll]
+                available_indices_in_roll = [i for i in range(len(roll_values)) if not (chosen_mask >> i) & 1]
                 available_dice_str = [f"({i+1}: {roll_values[i]})" for i in available_indices_in_roll]
                 renderer.display_message(" ".join(available_dice_str)) # Use renderer
 
                 available_values_for_scoring = [roll_values[i] for i in available_indices_in_roll]
-                available_objects_for_scoring = [roll_objects[i] for i in available_indices_in_roll]
-                current_possible_scores = calculate_score(available_values_for_scoring, available_objects_for_scoring)
+                current_possible_scores = calculate_score(available_values_for_scoring, river_pearl=self.has_river_pearl)
 
-                obsidian_present = any(isinstance(d, ObsidianFocusDie) for d in self.dice_loadout)
                 rerollable_indices_options = [i for i in available_indices_in_roll if roll_values[i] in [2, 3]]
-                can_offer_reroll = obsidian_present and self.can_reroll_special and rerollable_indices_options
+                can_offer_reroll = self.has_obsidian_focus and self.can_reroll_special and rerollable_indices_options
 
                 # Decide action based on possible scores and reroll availability
                 if not current_possible_scores:
@@ -221,7 +216,7 @@ class DiceGame:
                         action_data = None # Reroll logic below will handle selection
                     else:
                         # No scores, no reroll -> end selection for this roll
-                        if not chosen_indices_this_roll:
+                        if not chosen_mask:
                              renderer.display_message("No scoring dice available in this roll.")
                         else:
                              renderer.display_message("No further scoring combinations available with remaining dice.")
@@ -233,7 +228,7 @@ class DiceGame:
                     )
 
                 if action_type == "stop":
-                    if not chosen_indices_this_roll:
+                    if not chosen_mask:
                          renderer.display_message("You must set aside at least one scoring die/combo.")
                          continue
                     break # Done selecting for this roll
@@ -243,18 +238,17 @@ class DiceGame:
                     score = action_data["score"]
                     desc = action_data["desc"]
 
+                    # Index the available dice by value, lowest roll position last so pop() takes it first
+                    indices_by_value = defaultdict(list)
+                    for i in reversed(available_indices_in_roll):
+                        indices_by_value[roll_values[i]].append(i)
+
                     indices_to_add_this_combo = set()
-                    temp_available_indices = list(available_indices_in_roll)
                     possible_to_select = True
                     for val_needed in combo_values:
-                        found_idx_for_val = -1
-                        for check_idx in temp_available_indices:
-                            if roll_values[check_idx] == val_needed:
-                                found_idx_for_val = check_idx
-                                break
-                        if found_idx_for_val != -1:
-                            indices_to_add_this_combo.add(found_idx_for_val)
-                            temp_available_indices.remove(found_idx_for_val)
+                        matching_indices = indices_by_value[val_needed]
+                        if matching_indices:
+                            indices_to_add_this_combo.add(matching_indices.pop())
                         else:
                             renderer.display_message(f"Error: Could not find index for value {val_needed} in combo {combo_values} among available dice.")
                             possible_to_select = False
@@ -263,18 +257,17 @@ class DiceGame:
                     # Check if the combo was successfully selected
                     if possible_to_select and len(indices_to_add_this_combo) == len(combo_values):
                         # Check if any of the required dice were already set aside this roll
-                        if any(idx in chosen_indices_this_roll for idx in indices_to_add_this_combo):
+                        if any((chosen_mask >> idx) & 1 for idx in indices_to_add_this_combo):
                             renderer.display_message("Error: One or more dice for this combo already set aside this turn.")
                         else:
                             # Valid selection, update score and state
                             indices_str = str({i+1 for i in indices_to_add_this_combo})
                             renderer.display_message(f"Setting aside: {desc} {combo_values} (+{score}) using roll indices: {indices_str}")
-                            chosen_indices_this_roll.update(indices_to_add_this_combo)
-                            print(f"DEBUG: Adding score {score} to current_selection_score {current_selection_score}") # DEBUG
+                            for idx in indices_to_add_this_combo:
+                                chosen_mask |= 1 << idx
                             current_selection_score += score
-                            print(f"DEBUG: current_selection_score is now {current_selection_score}") # DEBUG
                             renderer.display_message(f"Score added this selection: {score}. Total set aside this roll: {current_selection_score}")
-                            available_indices_in_roll = [i for i in available_indices_in_roll if i not in chosen_indices_this_roll]
+                            available_indices_in_roll = [i for i in available_indices_in_roll if not (chosen_mask >> i) & 1]
                     elif possible_to_select: # This case means indices were found, but not enough for the combo length (shouldn't happen with current logic)
                          renderer.display_message(f"Error: Mismatch finding indices for combo {combo_values}. Found {len(indices_to_add_this_combo)}.")
 
@@ -307,7 +300,7 @@ class DiceGame:
             if trigger_outer_loop_restart:
                  continue # Go back to the start of the outer while loop
 
-            if not chosen_indices_this_roll:
+            if not chosen_mask:
                  renderer.display_message("Error: No dice were set aside this roll. Treating as bust.")
                  return 0
 
@@ -316,7 +309,7 @@ class DiceGame:
 
             new_dice_available_objects = []
             for i, die_obj in enumerate(current_roll_dice_objects):
-                 if i not in chosen_indices_this_roll:
+                 if not (chosen_mask >> i) & 1:
                       new_dice_available_objects.append(die_obj)
 
             if not new_dice_available_objects:
@@ -0,0 +1,18 @@
+# Helpers for status effect keys shared by Tools and Ailments
+from enum import IntEnum
+
+class StartEffect(IntEnum):
+    """Effects queued for the start of the player's next combat (keys of next_combat_start_effects)."""
+    DISTRACTED = 0 # Value is how many fewer cards are drawn at combat start
+    FOCUS = 1
+    CURSED = 2
+
+    def __str__(self):
+        return self.name.title() # "Distracted", "Focus", "Cursed"
+
+def split_effect_key(effect_name):
+    """Splits a status key like "Fragile_2" into ("Fragile", 2). Keys without a magnitude give 0."""
+    kind, sep, magnitude = effect_name.partition("_")
+    if sep and magnitude.isdigit():
+        return kind, int(magnitude)
+    return effect_name, 0
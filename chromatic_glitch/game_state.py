@@ -1,11 +1,18 @@
 # Manages the overall game state, including player progress, current phase, etc.
+import random
 from .ui.abstract_ui import AbstractRenderer, AbstractInputHandler # Import interfaces
 from .characters import PlayerCharacter # For type hinting
 
 class GameState:
     """Represents the current state of the game."""
+    __slots__ = (
+        "renderer", "input_handler", "current_phase", "player_character", "current_patient",
+        "available_patients", "shop", "shop_inventory", "currency", "current_encounter",
+        "seed", "rng",
+    )
+
     # Modified __init__ to accept UI handlers
-    def __init__(self, renderer: AbstractRenderer, input_handler: AbstractInputHandler):
+    def __init__(self, renderer: AbstractRenderer, input_handler: AbstractInputHandler, seed: int | None = None):
         self.renderer = renderer
         self.input_handler = input_handler
 
@@ -13,11 +20,15 @@ class GameState:
         self.player_character: PlayerCharacter | None = None
         self.current_patient = None
         self.available_patients = []
+        self.shop = None # Created on the first visit, then kept so its stock persists between visits
         self.shop_inventory = {}
         self.currency = 0
         self.current_encounter = [] # Ailments for the current treatment
+        # One RNG for the run; the seed is printed so a run can be replayed
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
         # Add other relevant state variables as needed
-        print("GameState initialized.")
+        print(f"GameState initialized (seed {self.seed}).")
 
     def transition_to_phase(self, next_phase):
         """Handles logic for changing game phases."""
@@ -29,6 +40,8 @@ class GameState:
 # --- Patient Class ---
 # Represents a patient needing treatment. Contains info about the encounter.
 class Patient:
+    __slots__ = ("name", "description", "ailment_types", "ailment_instances", "difficulty", "reward_focus", "turns_remaining")
+
     def __init__(self, name, description, ailment_types, ailment_instances, difficulty, reward_focus, turns=10):
         self.name = name
         self.description = description # Flavor text
@@ -64,12 +64,14 @@ class Consumable(Item):
 # Use string hint for PlayerCharacter here as well
 def use_soothing_poultice(player: 'PlayerCharacter', renderer: AbstractRenderer, target=None):
     """Heals the player's most damaged tool."""
+    # Find the active tool with the lowest absolute health in one pass (first one wins ties)
     target_tool = None
-    if player.tools:
-        active_tools = [t for t in player.tools if t.current_resonance > 0]
-        if active_tools:
-            # Find tool with lowest percentage health, or just lowest absolute health for simplicity
-            target_tool = min(active_tools, key=lambda t: t.current_resonance)
+    lowest_resonance = float('inf')
+    for tool in player.tools:
+        resonance = tool.current_resonance
+        if 0 < resonance < lowest_resonance:
+            lowest_resonance = resonance
+            target_tool = tool
 
     if target_tool:
         # heal method needs renderer
@@ -100,11 +102,11 @@ class ResonatorCrystal(Equipment):
         # Define effect functions locally or import them
         # Effect functions no longer print directly
         def apply_effect(player):
-            setattr(player, 'dice_score_bonus', getattr(player, 'dice_score_bonus', 0) + 50)
+            player.dice_score_bonus += 50
             # Message moved to Equipment.apply_effect
 
         def remove_effect(player):
-            setattr(player, 'dice_score_bonus', getattr(player, 'dice_score_bonus', 50) - 50)
+            player.dice_score_bonus -= 50
             # Message moved to Equipment.remove_effect
 
         super().__init__(name="Resonator Crystal",
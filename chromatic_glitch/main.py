@@ -57,8 +57,9 @@ def run_game():
     # Start the first cycle with the Omen phase
     game_state.transition_to_phase("OMEN")
 
+    get_phase_handler = PHASE_HANDLERS.get # Looked up once for the life of the loop
     while game_state.current_phase != "EXIT":
-        handler = PHASE_HANDLERS.get(game_state.current_phase)
+        handler = get_phase_handler(game_state.current_phase)
         if handler:
             handler(game_state)
         else:
@@ -4,10 +4,10 @@ import random
 # No longer need direct UI imports
 # from ..ui import input_handler, renderer
 # Import some basic cards to offer as rewards
-from ..cards import Strike, Mend, Guard, Soothe
+from ..cards import STRIKE, MEND, GUARD, SOOTHE
 
 # Simple reward pool for now
-BASIC_CARD_REWARDS = [Strike(), Mend(), Guard(), Soothe()]
+BASIC_CARD_REWARDS = [STRIKE, MEND, GUARD, SOOTHE]
 
 def handle_aftermath_phase(game_state):
     """Handles the logic for the Aftermath phase."""
@@ -36,13 +36,11 @@ def handle_aftermath_phase(game_state):
     renderer.display_message("\nYou gained some insight:")
     # Offer 3 random basic cards
     num_choices = 3
-    # Create new instances for reward options
-    reward_pool = [type(card)() for card in BASIC_CARD_REWARDS]
-    reward_options = random.sample(reward_pool, min(num_choices, len(reward_pool)))
+    # Basic cards are shared instances, so offer them directly
+    reward_options = random.sample(BASIC_CARD_REWARDS, min(num_choices, len(BASIC_CARD_REWARDS)))
 
     if reward_options:
-        option_strings = [str(card) for card in reward_options]
-        option_strings.append("Skip card reward") # Add skip option
+        option_strings = [str(card) for card in reward_options] + ["Skip card reward"] # Add skip option
 
         prompt = "Choose a card to add to your collection:"
         # Use injected handler
@@ -51,7 +49,7 @@ def handle_aftermath_phase(game_state):
         if choice_index < len(reward_options): # Check if a card was chosen (not skip)
             chosen_card = reward_options[choice_index]
             # Add to collection (deck management happens in Prep phase)
-            player.card_collection.append(chosen_card)
+            player.add_card(chosen_card)
             renderer.display_message(f"Added {chosen_card.name} to your collection.")
         else:
             renderer.display_message("You chose to skip the card reward.")
@@ -1,9 +1,48 @@
 # Logic for the Omen Phase (Random Encounters)
 
 import random
+from ..effects import StartEffect
 # No longer need direct UI imports here
 # from ..ui import input_handler, renderer
 
+# --- Trail Shrine ---
+# Each option is handled by its own function; events dispatch on the chosen index
+
+def _shrine_offer_thanks(player, renderer, input_handler):
+    # Heal one Tool (choose randomly for now)
+    target_tool = None
+    if player.tools:
+         active_tools = [t for t in player.tools if t.current_resonance > 0]
+         if active_tools:
+              target_tool = random.choice(active_tools)
+    if target_tool:
+         healed = target_tool.heal(15, renderer) # Pass renderer
+         renderer.display_message(f"You offer thanks. {target_tool.name} feels restored (+{healed} Resonance).")
+    else:
+         renderer.display_message("You offer thanks, but your tools are already whole or broken.")
+
+def _shrine_offer_currency(player, renderer, input_handler):
+    cost = 50
+    if player.currency >= cost:
+        player.currency -= cost
+        renderer.display_message(f"You offer {cost} currency. You feel a subtle shift in your Melodies... (Card Enhance TBD)")
+        # TODO: Implement card enhancement logic
+    else:
+        renderer.display_message(f"You don't have enough currency ({cost} needed). The shrine remains silent.")
+
+def _shrine_scavenge(player, renderer, input_handler):
+    gain = random.randint(20, 40)
+    player.currency += gain
+    renderer.display_message(f"You scavenge the offerings, finding {gain} currency. You feel a pang of guilt.")
+    # TODO: Implement small chance of 'Cursed' status
+
+TRAIL_SHRINE_OPTIONS = (
+    "Offer thanks (Heal one Tool by 15 Resonance)",
+    "Offer currency (Pay 50 Currency: Enhance a random card?)", # Enhance TBD
+    "Scavenge offerings (Gain 20-40 Currency, small risk?)" # Risk TBD
+)
+TRAIL_SHRINE_HANDLERS = (_shrine_offer_thanks, _shrine_offer_currency, _shrine_scavenge)
+
 def trail_shrine_event(game_state):
     """Example Omen Event: Trail Shrine."""
     # Get UI handlers from game_state
@@ -11,43 +50,46 @@ def trail_shrine_event(game_state):
     input_handler = game_state.input_handler
 
     renderer.display_message("\nYou come across a small, moss-covered shrine offering respite.")
-    options = [
-        "Offer thanks (Heal one Tool by 15 Resonance)",
-        "Offer currency (Pay 50 Currency: Enhance a random card?)", # Enhance TBD
-        "Scavenge offerings (Gain 20-40 Currency, small risk?)" # Risk TBD
-    ]
     prompt = "What do you do?"
     # Use injected input handler
-    choice_index, _ = input_handler.get_player_choice(prompt, options)
+    choice_index, _ = input_handler.get_player_choice(prompt, list(TRAIL_SHRINE_OPTIONS))
 
     player = game_state.player_character
     if not player: return # Safety check
 
-    if choice_index == 0:
-        # Heal one Tool (choose randomly for now)
-        target_tool = None
-        if player.tools:
-             active_tools = [t for t in player.tools if t.current_resonance > 0]
-             if active_tools:
-                  target_tool = random.choice(active_tools)
-        if target_tool:
-             healed = target_tool.heal(15, renderer) # Pass renderer
-             renderer.display_message(f"You offer thanks. {target_tool.name} feels restored (+{healed} Resonance).")
-        else:
-             renderer.display_message("You offer thanks, but your tools are already whole or broken.")
-    elif choice_index == 1:
-        cost = 50
-        if player.currency >= cost:
-            player.currency -= cost
-            renderer.display_message(f"You offer {cost} currency. You feel a subtle shift in your Melodies... (Card Enhance TBD)")
-            # TODO: Implement card enhancement logic
-        else:
-            renderer.display_message(f"You don't have enough currency ({cost} needed). The shrine remains silent.")
-    elif choice_index == 2:
-        gain = random.randint(20, 40)
-        player.currency += gain
-        renderer.display_message(f"You scavenge the offerings, finding {gain} currency. You feel a pang of guilt.")
-        # TODO: Implement small chance of 'Cursed' status
+    TRAIL_SHRINE_HANDLERS[choice_index](player, renderer, input_handler)
+
+# --- Cicada Drone ---
+
+def _drone_push_through(player, renderer, input_handler):
+    renderer.display_message("You push through the noise, but it leaves you slightly distracted.")
+    # Apply 'Distracted' effect for the next combat
+    player.next_combat_start_effects[StartEffect.DISTRACTED] = 1 # Value could represent intensity/duration if needed
+
+def _drone_harmonize(player, renderer, input_handler):
+    renderer.display_message("You attempt to find harmony within the overwhelming drone...")
+    # Need DiceGame access here
+    from ..dice import DiceGame # Local import for now
+    dice_game = DiceGame(player) # Pass the player object
+    # Pass the UI handlers from game_state to play_game
+    score = dice_game.play_game(renderer, input_handler)
+    target_score = 500
+    if score >= target_score:
+        renderer.display_message(f"Success! ({score}/{target_score}) You find focus in the pattern. (+50 Dice Score next combat)")
+        # Apply 'Focus' effect for the next combat
+        player.next_combat_start_effects[StartEffect.FOCUS] = 1 # Example: 1 turn duration
+    else:
+        renderer.display_message(f"Failure! ({score}/{target_score}) The dissonance overwhelms you.")
+        damage = 5
+        for tool in player.tools:
+             if tool.current_resonance > 0:
+                  tool.take_damage(damage, renderer) # Pass renderer
+
+CICADA_DRONE_OPTIONS = (
+    "Push through the sound (Start next combat with 'Distracted' -1 Card Draw first turn?)", # Effect TBD
+    "Harmonize with the drone (Attempt Dice Roll - Target 500. Success: +50 Dice Score buff; Fail: 5 damage to all Tools)"
+)
+CICADA_DRONE_HANDLERS = (_drone_push_through, _drone_harmonize)
 
 def cicada_drone_event(game_state):
     """Example Omen Event: Cicada Drone."""
@@ -56,47 +98,22 @@ def cicada_drone_event(game_state):
     input_handler = game_state.input_handler
 
     text = "\nAn unnerving, synchronous drone from millions of cicadas fills the air, fraying your focus."
-    options = [
-        "Push through the sound (Start next combat with 'Distracted' -1 Card Draw first turn?)", # Effect TBD
-        "Harmonize with the drone (Attempt Dice Roll - Target 500. Success: +50 Dice Score buff; Fail: 5 damage to all Tools)"
-    ]
     prompt = "How do you react?"
     renderer.display_message(text) # Display text separately
-    choice_index, _ = input_handler.get_player_choice(prompt, options)
+    choice_index, _ = input_handler.get_player_choice(prompt, list(CICADA_DRONE_OPTIONS))
 
     player = game_state.player_character
     if not player: return
 
-    if choice_index == 0:
-        renderer.display_message("You push through the noise, but it leaves you slightly distracted.")
-        # Apply 'Distracted' effect for the next combat
-        player.next_combat_start_effects["Distracted"] = 1 # Value could represent intensity/duration if needed
-    elif choice_index == 1:
-        renderer.display_message("You attempt to find harmony within the overwhelming drone...")
-        # Need DiceGame access here
-        from ..dice import DiceGame # Local import for now
-        dice_game = DiceGame(player) # Pass the player object
-        # Pass the UI handlers from game_state to play_game
-        score = dice_game.play_game(renderer, input_handler)
-        target_score = 500
-        if score >= target_score:
-            renderer.display_message(f"Success! ({score}/{target_score}) You find focus in the pattern. (+50 Dice Score next combat)")
-            # Apply 'Focus' effect for the next combat
-            player.next_combat_start_effects["Focus"] = 1 # Example: 1 turn duration
-        else:
-            renderer.display_message(f"Failure! ({score}/{target_score}) The dissonance overwhelms you.")
-            damage = 5
-            for tool in player.tools:
-                 if tool.current_resonance > 0:
-                      tool.take_damage(damage)
-
-
-# List of possible event functions
-OMEN_EVENTS = [
+    CICADA_DRONE_HANDLERS[choice_index](player, renderer, input_handler)
+
+
+# Possible event functions
+OMEN_EVENTS = (
     trail_shrine_event,
     cicada_drone_event,
     # Add other event functions here later (lost_child, etc.)
-]
+)
 
 def handle_omen_phase(game_state):
     """Handles the logic for the Omen phase."""
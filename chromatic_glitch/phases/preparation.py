@@ -9,14 +9,16 @@ from ..game_state import Patient # Import the Patient class
 from ..items import Equipment # Need Equipment class
 
 # --- Patient Generation ---
+# Every patient currently faces the same pair of ailments
+PATIENT_AILMENT_CLASSES = (CrawlingAnxiety, SensorySpike)
+PATIENT_AILMENT_TYPES = tuple(cls.__name__ for cls in PATIENT_AILMENT_CLASSES)
+
 # This function doesn't need UI handlers
 def generate_patient():
     """Generates a random patient encounter (placeholder)."""
     # TODO: Implement more varied patient generation based on progress/difficulty
-    ailment1 = CrawlingAnxiety()
-    ailment2 = SensorySpike()
-    # Ensure new instances are created each time
-    encounter_ailments = [type(ailment1)(), type(ailment2)()]
+    # Fresh instances per patient: ailments carry per-fight resonance and status effects
+    encounter_ailments = [cls() for cls in PATIENT_AILMENT_CLASSES]
     name = random.choice(["Disturbed Villager", "Frightened Child", "Weary Elder"])
     description = random.choice([
         "Murmurs incoherently, clutching their head.",
@@ -25,7 +27,7 @@ def generate_patient():
     ])
     difficulty = random.choice(["Easy", "Medium"]) # Example
     reward_focus = random.choice(["Card", "Currency", "Item (TBD)"]) # Example
-    ailment_types = [type(a).__name__ for a in encounter_ailments] # Get class names
+    ailment_types = list(PATIENT_AILMENT_TYPES) # Class names
 
     return Patient(name, description, ailment_types, encounter_ailments, difficulty, reward_focus)
 
@@ -46,6 +48,10 @@ def handle_preparation_phase(game_state):
     for tool in player.tools:
         renderer.display_message(f"  - {tool}") # Use injected renderer
 
+    # A new preparation phase is the shop's restock event
+    if game_state.shop is not None:
+        game_state.shop.refresh_inventory()
+
     # --- Generate Patient Options ---
     num_patient_options = 3
     game_state.available_patients = [generate_patient() for _ in range(num_patient_options)]
@@ -64,6 +70,8 @@ def handle_preparation_phase(game_state):
 
 
     # --- Prep Menu Loop ---
+    # Equipment only changes through Equip Item, so its slot lines are rebuilt only after that
+    equipment_lines = None
     while True:
         # Display status again in case it changed (e.g., after shop/equip)
         renderer.display_message("\n--- Preparation Options ---")
@@ -72,8 +80,10 @@ def handle_preparation_phase(game_state):
         for tool in player.tools:
             renderer.display_message(f"  - {tool}")
         renderer.display_message("Equipment:")
-        for i, item in enumerate(player.equipment):
-            renderer.display_message(f"  Slot {i+1}: {item.name if item else 'Empty'}")
+        if equipment_lines is None:
+            equipment_lines = [f"  Slot {i+1}: {item.name if item else 'Empty'}" for i, item in enumerate(player.equipment)]
+        for line in equipment_lines:
+            renderer.display_message(line)
 
 
         options = ["View Deck", "View Dice", "View Items", "Equip Item", "Manage Dice Loadout", "Visit Shop", "Start Treatment"]
@@ -92,6 +102,7 @@ def handle_preparation_phase(game_state):
             input_handler.wait_for_acknowledgement() # Use handler
         elif choice_text == "Equip Item":
             handle_equip_item(game_state)
+            equipment_lines = None # Slots may have changed
         elif choice_text == "Manage Dice Loadout":
             handle_manage_dice(game_state) # Call new function
         elif choice_text == "Visit Shop":
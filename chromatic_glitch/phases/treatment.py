@@ -4,7 +4,128 @@ from ..ailments import CrawlingAnxiety, SensorySpike # Import ailments
 # No longer need direct UI imports
 # from ..ui import renderer, input_handler
 from ..dice import DiceGame # Import the DiceGame class
+from ..cards import CardType
 import time # For potential pauses
+from ..actions import Action
+from ..effects import StartEffect
+
+def _remove_from_hand(player, card_index):
+    """Moves a played card to the discard pile in O(1) by swapping the last card into its slot.
+    Hand order is not kept mid-turn; the hand is re-listed before every action, so indices stay valid."""
+    hand = player.hand
+    hand[card_index], hand[-1] = hand[-1], hand[card_index]
+    player.discard_pile.append(hand.pop())
+
+def _prune_defeated(ailments):
+    """Returns ailments without the defeated ones. Hands back the same list, unallocated, when none were defeated."""
+    for ailment in ailments:
+        if not ailment.is_alive:
+            return [a for a in ailments if a.is_alive]
+    return ailments
+
+def _is_slowed(ailment):
+    """Slowed ailments act after the rest. The counter is kept in sync by add/tick status effects."""
+    return ailment.slow_stacks > 0
+
+def _ailments_act(ailments, player, game_state, alive_tools):
+    """Lets each ailment choose and perform its action. Returns how many Tools are left intact; stops early at 0."""
+    for ailment in ailments:
+        # Re-check resonance in case they were defeated by something else? Unlikely but possible.
+        if ailment.current_resonance <= 0:
+            continue
+        ailment.determine_intent(player.tools, game_state) # Ailment decides what to do
+        # Pauses should be handled by UI layer if needed
+        if ailment.act(player, game_state): # True when the action broke a Tool
+            alive_tools -= 1
+            if alive_tools == 0:
+                break
+    return alive_tools
+
+# --- Combat Action Handlers ---
+# Each takes (player, active_ailments, game_state, action_data) and returns True if the player's turn is over
+
+def _play_card(player, active_ailments, game_state, action_data):
+    renderer = game_state.renderer
+    card_index = action_data["card_index"]
+    target_index = action_data["target_index"] # Placeholder for now
+    card_to_play = player.hand[card_index]
+
+    if player.current_ap < card_to_play.cost:
+        renderer.display_message(f"Not enough AP to play {card_to_play.name} (Cost: {card_to_play.cost}, Have: {player.current_ap})")
+        return False
+
+    player.current_ap -= card_to_play.cost
+    # Card execute methods should handle their own messages via renderer
+
+    # Determine target (very basic placeholder)
+    target = None
+    # Check target_index before accessing lists
+    if target_index is not None and target_index >= 0:
+        if card_to_play.card_type == CardType.MELODY:
+            if target_index < len(active_ailments):
+                target = active_ailments[target_index]
+            else:
+                renderer.display_message("Invalid Ailment target index.")
+        elif card_to_play.card_type == CardType.HARMONY:
+            if target_index < len(player.tools):
+                target = player.tools[target_index]
+            else:
+                renderer.display_message("Invalid Tool target index.")
+        # TODO: Add targeting for Chant cards
+
+    # Check if card triggers dice game
+    dice_score = 0
+    if card_to_play.triggers_dice_game:
+        dice_game = DiceGame(player) # Pass the player object
+        # Pause is handled within play_game if needed by the UI impl
+        dice_score = dice_game.play_game(renderer, game_state.input_handler)
+
+    if target_index not in (-1, -2) and not target: # Invalid target selected or required target missing
+        renderer.display_message("Invalid target selected or target became invalid.")
+        # Refund AP
+        player.current_ap += card_to_play.cost
+        renderer.display_message(f"AP refunded (+{card_to_play.cost}).")
+        return False # Let player choose another action
+
+    # Resolving the card prompts for nothing, so its messages go out as one frame
+    with renderer.batch():
+        if target_index == -1: # Self / No target selection needed
+            card_to_play.execute(player, None, game_state, dice_score=dice_score)
+        elif target_index == -2: # AoE / Multi-target
+            targets = card_to_play.get_aoe_targets(player, active_ailments)
+            if targets is not None:
+                card_to_play.execute(player, targets, game_state, dice_score=dice_score)
+            else:
+                renderer.display_message(f"Warning: Automatic targeting for {card_to_play.name} not fully defined.")
+        else: # Valid single target selected
+            card_to_play.execute(player, target, game_state, dice_score=dice_score)
+    _remove_from_hand(player, card_index)
+    return False
+
+def _use_consumable(player, active_ailments, game_state, action_data):
+    item_name = action_data["item_name"]
+    item_object = action_data["item_object"]
+    # Using items might cost AP in the future, but not currently
+    with game_state.renderer.batch():
+        used = item_object.use(player, game_state.renderer) # Pass player context
+    if used:
+        # Decrement consumable count
+        player.consumables[item_name] -= 1
+        if player.consumables[item_name] == 0:
+            del player.consumables[item_name]
+    else:
+        game_state.renderer.display_message(f"Failed to use {item_name}.")
+    return False
+
+def _end_turn(player, active_ailments, game_state, action_data):
+    return True
+
+# Built once at import; indexed by the Action the input handler returns
+_ACTION_HANDLERS = {
+    Action.PLAY_CARD: _play_card,
+    Action.USE_CONSUMABLE: _use_consumable,
+    Action.END_TURN: _end_turn,
+}
 
 def handle_treatment_phase(game_state):
     """Handles the logic for the Treatment phase (combat)."""
@@ -30,26 +151,25 @@ def handle_treatment_phase(game_state):
          # Important: Create copies or new instances if ailments have state that shouldn't persist
          # For now, assume the prep phase created fresh instances
          active_ailments = game_state.current_encounter
-         renderer.display_message(f"Engaging: {[a.name for a in active_ailments]}")
+         if renderer.enabled: renderer.display_message("Engaging: " + ", ".join(a.name for a in active_ailments))
          # Clear the encounter from game_state after starting? Optional.
          # game_state.current_encounter = None
 
     # Reset player combat state using the new method
-    # TODO: Refactor start_combat if it prints messages
-    player.start_combat()
+    player.start_combat(renderer)
     # Tool health persists between combats based on previous decision
 
     # --- Apply Next Combat Start Effects ---
     initial_draw_amount = 5 # Default draw
-    if "Distracted" in player.next_combat_start_effects:
-        draw_reduction = player.next_combat_start_effects["Distracted"] # Assuming value is reduction amount
+    draw_reduction = player.next_combat_start_effects.get(StartEffect.DISTRACTED) # Value is the reduction amount
+    if draw_reduction is not None:
         initial_draw_amount = max(0, initial_draw_amount - draw_reduction)
         renderer.display_message(f"Distracted! Initial draw reduced by {draw_reduction}.")
         # TODO: Apply other start-of-combat effects like Focus, Cursed etc.
-        # Example: if "Focus" in player.next_combat_start_effects: player.status_effects["Focus"] = duration...
+        # Example: if StartEffect.FOCUS in player.next_combat_start_effects: player.status_effects["Focus"] = duration...
 
     # Clear the effects after applying them
-    player.next_combat_start_effects = {}
+    player.next_combat_start_effects.clear()
     # --- End Apply Effects ---
 
 
@@ -59,18 +179,17 @@ def handle_treatment_phase(game_state):
     # --- Main Combat Loop ---
     while not combat_over:
         # -- Player Turn --
-        # TODO: Refactor start_turn if it prints messages
-        player.start_turn()
-        # Tick status effects on player's tools at start of turn
-        renderer.display_message("Ticking Tool Effects:") # Use renderer
-        for tool in player.tools:
-            if tool.current_resonance > 0: # Don't tick broken tools
-                # TODO: Refactor tick_status_effects if it prints messages
-                tool.tick_status_effects()
-        # TODO: Tick player character status effects?
-
-        # TODO: Refactor draw_card if it prints messages
-        player.draw_card(initial_draw_amount) # Use potentially modified draw amount
+        # Start-of-turn bookkeeping is shown as one block
+        with renderer.batch():
+            player.start_turn(renderer)
+            # Tick status effects on player's tools at start of turn
+            renderer.display_message("Ticking Tool Effects:") # Use renderer
+            for tool in player.tools:
+                if tool.current_resonance > 0: # Don't tick broken tools
+                    tool.tick_status_effects(renderer)
+            # TODO: Tick player character status effects?
+
+            player.draw_card(initial_draw_amount, renderer) # Use potentially modified draw amount
 
         player_turn_over = False
         while not player_turn_over:
@@ -87,149 +206,44 @@ def handle_treatment_phase(game_state):
             # Use injected input handler
             action_type, action_data = input_handler.get_combat_action(player, active_ailments)
 
-            if action_type == "PLAY_CARD":
-                card_index = action_data["card_index"]
-                target_index = action_data["target_index"] # Placeholder for now
-                card_to_play = player.hand[card_index]
-
-                if player.current_ap >= card_to_play.cost:
-                    player.current_ap -= card_to_play.cost
-                    # Card execute methods should handle their own messages via renderer
-                    # renderer.display_message(f"Playing {card_to_play.name}...")
-
-                    # Determine target (very basic placeholder)
-                    target = None
-                    # Check target_index before accessing lists
-                    if target_index is not None and target_index >= 0:
-                        if card_to_play.card_type == "Melody":
-                            if target_index < len(active_ailments):
-                                target = active_ailments[target_index]
-                            else:
-                                renderer.display_message("Invalid Ailment target index.") # Use renderer
-                                target = None # Ensure target is None if index invalid
-                        elif card_to_play.card_type == "Harmony":
-                            if target_index < len(player.tools):
-                                target = player.tools[target_index]
-                            else:
-                                renderer.display_message("Invalid Tool target index.") # Use renderer
-                                target = None # Ensure target is None if index invalid
-                        # TODO: Add targeting for Chant cards
-
-                    # Check if card triggers dice game
-                    dice_score = 0
-                    if hasattr(card_to_play, 'triggers_dice_game') and card_to_play.triggers_dice_game:
-                        dice_game = DiceGame(player) # Pass the player object
-                        # Pass renderer and input_handler to play_game
-                        dice_score = dice_game.play_game(renderer, input_handler)
-                        # Pause is now handled within play_game if needed by the UI impl
-                        # input_handler.wait_for_acknowledgement("Press Enter to continue after Dice Game...")
-
-
-                    # Handle card execution based on target_index
-                    # Card execute methods need refactoring to use game_state.renderer
-                    if target_index == -1: # Self / No target selection needed
-                         card_to_play.execute(player, None, game_state, dice_score=dice_score)
-                         player.discard_pile.append(player.hand.pop(card_index))
-                    elif target_index == -2: # AoE / Multi-target
-                         if card_to_play.name == "Harmonic Pulse":
-                              card_to_play.execute(player, player.tools, game_state, dice_score=dice_score)
-                         elif card_to_play.name == "Echoing Shout":
-                              card_to_play.execute(player, active_ailments, game_state, dice_score=dice_score)
-                         else:
-                              renderer.display_message(f"Warning: Automatic targeting for {card_to_play.name} not fully defined.")
-                         player.discard_pile.append(player.hand.pop(card_index))
-                    elif target: # Valid single target selected
-                        card_to_play.execute(player, target, game_state, dice_score=dice_score)
-                        player.discard_pile.append(player.hand.pop(card_index))
-                    else: # Invalid target selected or required target missing
-                        renderer.display_message("Invalid target selected or target became invalid.")
-                        # Refund AP
-                        player.current_ap += card_to_play.cost
-                        renderer.display_message(f"AP refunded (+{card_to_play.cost}).")
-                        continue # Let player choose another action
-
-                else:
-                    renderer.display_message(f"Not enough AP to play {card_to_play.name} (Cost: {card_to_play.cost}, Have: {player.current_ap})")
-
-            elif action_type == "USE_CONSUMABLE":
-                 item_name = action_data["item_name"]
-                 item_object = action_data["item_object"]
-                 # Using items might cost AP in the future, but not currently
-                 # TODO: Refactor item use method if it prints messages
-                 if item_object.use(player): # Pass player context
-                      # Decrement consumable count
-                      player.consumables[item_name] -= 1
-                      if player.consumables[item_name] == 0:
-                           del player.consumables[item_name]
-                 else:
-                      renderer.display_message(f"Failed to use {item_name}.") # Use renderer
-
-            elif action_type == "END_TURN":
-                player_turn_over = True
+            # Each handler reports whether the action ended the player's turn
+            player_turn_over = _ACTION_HANDLERS[action_type](player, active_ailments, game_state, action_data)
 
             # Check for combat end after player action (card play or item use)
-            active_ailments = [a for a in active_ailments if a.current_resonance > 0]
+            active_ailments = _prune_defeated(active_ailments)
             if not active_ailments:
                 combat_over = True
                 player_victory = True
                 break # Exit inner player turn loop
 
-        player.end_turn()
+        player.end_turn(renderer)
         if combat_over: break # Exit outer combat loop if player won
 
         # -- Ailment Turn --
-        renderer.display_message("\n--- Ailment Turn ---") # Use renderer
-        # Separate ailments based on Slow status
-        slowed_ailments = []
-        normal_ailments = []
-        for ailment in active_ailments:
-             if ailment.current_resonance > 0:
-                  is_slowed = any(key.startswith("Slow_") for key in ailment.status_effects)
-                  if is_slowed:
-                       slowed_ailments.append(ailment)
-                  else:
-                       normal_ailments.append(ailment)
-
-        # Normal ailments act first
-        renderer.display_message("--- Normal Ailments Acting ---") # Use renderer
-        for ailment in normal_ailments:
-            # Pass game_state for renderer access
-            ailment.determine_intent(player.tools, game_state) # Ailment decides what to do
-            # time.sleep(0.5) # Pauses should be handled by UI layer if needed
-            ailment.act(player, game_state) # Ailment performs action
-            # time.sleep(0.5) # Pauses should be handled by UI layer if needed
-
-            # Check if player lost after ailment action
-            active_tools = [t for t in player.tools if t.current_resonance > 0]
-            if not active_tools:
+        # The whole ailment turn is output only, so flush it as one block
+        with renderer.batch():
+            renderer.display_message("\n--- Ailment Turn ---") # Use renderer
+            # Counted once per ailment turn; each act() reports whether it broke a Tool
+            alive_tools = sum(1 for t in player.tools if t.current_resonance > 0)
+            # Separate ailments based on Slow status in one pass
+            normal_ailments, slowed_ailments = [], []
+            for ailment in active_ailments:
+                if ailment.current_resonance > 0:
+                    (slowed_ailments if _is_slowed(ailment) else normal_ailments).append(ailment)
+
+            # Normal ailments act first, slowed ailments act last
+            renderer.display_message("--- Normal Ailments Acting ---") # Use renderer
+            alive_tools = _ailments_act(normal_ailments, player, game_state, alive_tools)
+            if alive_tools:
+                renderer.display_message("--- Slowed Ailments Acting ---") # Use renderer
+                alive_tools = _ailments_act(slowed_ailments, player, game_state, alive_tools)
+            if not alive_tools:
                 combat_over = True
                 player_victory = False
-                break # Exit ailment loop
-
-        if combat_over: break # Exit outer combat loop if player lost
-
-        # Slowed ailments act last
-        renderer.display_message("--- Slowed Ailments Acting ---") # Use renderer
-        for ailment in slowed_ailments:
-             # Re-check resonance in case they were defeated by something else? Unlikely but possible.
-             if ailment.current_resonance > 0:
-                # Pass game_state for renderer access
-                ailment.determine_intent(player.tools, game_state) # Ailment decides what to do
-                # time.sleep(0.5) # Pauses should be handled by UI layer if needed
-                ailment.act(player, game_state) # Ailment performs action
-                # time.sleep(0.5) # Pauses should be handled by UI layer if needed
-
-                # Check if player lost after ailment action
-                active_tools = [t for t in player.tools if t.current_resonance > 0]
-                if not active_tools:
-                    combat_over = True
-                    player_victory = False
-                    break # Exit ailment loop
-
-        if combat_over: break # Exit outer combat loop if player lost
+                break # Exit outer combat loop if player lost
 
         # Remove defeated ailments for the next turn display/targeting
-        active_ailments = [a for a in active_ailments if a.current_resonance > 0]
+        active_ailments = _prune_defeated(active_ailments)
         if not active_ailments and not player_victory: # Double check win condition
              combat_over = True
              player_victory = True
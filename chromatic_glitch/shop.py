@@ -10,28 +10,37 @@ from .items import SoothingPoultice, ResonatorCrystal, Equipment, Consumable # I
 # Need game_state for UI handlers
 # from .game_state import GameState # Avoid direct import if possible
 
+def _check_random_state(rng):
+    """Turns None (fresh unseeded RNG), an int seed, or an existing random.Random into a random.Random."""
+    if rng is None or isinstance(rng, int):
+        return random.Random(rng)
+    if isinstance(rng, random.Random):
+        return rng
+    raise ValueError(f"{rng!r} cannot be used to seed a random.Random instance")
+
 class Shop:
     """Manages the shop inventory and player interactions."""
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = _check_random_state(rng) # Normally the run's game_state.rng
         self.inventory_cards = []
         self.inventory_items = []
         self.inventory_dice = []
         self.card_enhancement_cost = 100 # Base cost, will scale
         self.refresh_inventory()
-        print("Shop initialized.")
 
     def refresh_inventory(self):
-        """Refreshes the shop's inventory (placeholder)."""
-        print("Refreshing shop inventory...")
-        # TODO: Populate with actual random/curated items/cards/dice
+        """Refreshes the shop's inventory (placeholder). Called on creation and on each restock."""
         # TODO: Populate with actual random/curated items/cards/dice
         self.inventory_cards = []
         # Add some basic items for now
-        self.inventory_items = [SoothingPoultice() for _ in range(random.randint(1, 3))]
+        self.inventory_items = [SoothingPoultice() for _ in range(self.rng.randint(1, 3))]
         # Add equipment example
-        if random.random() < 0.5: # Chance to have equipment
+        if self.rng.random() < 0.5: # Chance to have equipment
              self.inventory_items.append(ResonatorCrystal())
         self.inventory_dice = []
+        # Buy menu lines, built once per restock and kept aligned with inventory_items; "Cancel" stays last
+        self._item_option_cache = [f"{item} (Cost: {getattr(item, 'cost', 'N/A')})" for item in self.inventory_items]
+        self._item_option_cache.append("Cancel")
         # Don't print here, let renderer handle it
         # print("Shop inventory refreshed.")
 
@@ -84,11 +93,9 @@ class Shop:
             renderer.display_message("There are no items for sale.")
             return
 
-        item_options = [f"{item} (Cost: {getattr(item, 'cost', 'N/A')})" for item in self.inventory_items]
-        item_options.append("Cancel")
         prompt = "Which item would you like to buy?"
         # Use injected handler
-        choice_index, _ = input_handler.get_player_choice(prompt, item_options)
+        choice_index, _ = input_handler.get_player_choice(prompt, self._item_option_cache)
 
         if choice_index == len(self.inventory_items): # Cancelled
             renderer.display_message("Purchase cancelled.")
@@ -104,11 +111,7 @@ class Shop:
                 player.currency -= cost
                 # Add item to player inventory
                 if isinstance(item_to_buy, Consumable):
-                     current_count = player.consumables.get(item_to_buy.name, 0)
-                     player.consumables[item_to_buy.name] = current_count + 1
-                     # Ensure the item object is in the collection for later use
-                     if not any(isinstance(item, type(item_to_buy)) for item in player.item_collection):
-                          player.item_collection.append(item_to_buy)
+                     player.add_consumable(item_to_buy)
                      renderer.display_message(f"Purchased {item_to_buy.name}. You now have {player.consumables[item_to_buy.name]}.")
                 elif isinstance(item_to_buy, Equipment):
                      player.item_collection.append(item_to_buy)
@@ -116,8 +119,9 @@ class Shop:
                 else:
                      renderer.display_message(f"Purchased unknown item type: {item_to_buy.name}")
 
-                # Remove item from shop inventory
+                # Remove item from shop inventory, and its menu line with it
                 self.inventory_items.pop(choice_index)
+                self._item_option_cache.pop(choice_index)
             else:
                 renderer.display_message("Purchase cancelled.")
         else:
@@ -138,8 +142,8 @@ class Shop:
             return
 
         renderer.display_message("Select a card from your collection to enhance:")
-        # Filter out already enhanced cards? Or let enhance method handle it.
-        enhanceable_cards = [card for card in player.card_collection if not card.name.endswith('+')]
+        # Maintained by the player as cards are added and enhanced
+        enhanceable_cards = player.enhanceable_cards
         if not enhanceable_cards:
              renderer.display_message("All cards in your collection are already enhanced.")
              return
@@ -165,10 +169,7 @@ class Shop:
             if input_handler.confirm_action("Confirm enhancement?"):
                 player.currency -= cost
                 # Card enhance method already prints messages
-                if card_to_enhance.enhance():
-                     # renderer.display_message(f"Successfully enhanced {card_to_enhance.name}!") # Enhance method prints
-                     pass # Enhance method handles success message
-                else:
+                if player.enhance_card(card_to_enhance, renderer) is None:
                      renderer.display_message(f"Could not enhance {card_to_enhance.name}.") # Should not happen if filtered
                      player.currency += cost # Refund if failed unexpectedly
             else:
@@ -179,7 +180,8 @@ class Shop:
 
 def enter_shop(game_state):
     """Entry point for visiting the shop."""
-    # TODO: Shop instance should likely persist in game_state for inventory continuity
-    shop = Shop() # New shop instance each time for now
+    # One shop per run; its stock carries over between visits until the next restock
+    if game_state.shop is None:
+        game_state.shop = Shop(game_state.rng)
     # Pass game_state to handle_shop_visit
-    shop.handle_shop_visit(game_state)
+    game_state.shop.handle_shop_visit(game_state)
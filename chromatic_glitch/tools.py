@@ -1,39 +1,49 @@
 # Defines the Tool class (player instruments)
 # Import UI interfaces for type hinting
 from .ui.abstract_ui import AbstractRenderer
+from .effects import split_effect_key
+
+# Effect kinds that count as buffs (e.g. for Lyra's Insight)
+POSITIVE_EFFECTS = frozenset({"Resonance", "Guard"})
 
 class Tool:
     """Represents a player's instrument/tool in combat."""
+    # Tools are hit, healed and ticked every turn, so keep attribute access on slots
+    __slots__ = ("name", "max_resonance", "current_resonance", "status_effects", "positive_effect_count", "regen_per_tick", "position")
+
     def __init__(self, name, max_resonance):
         self.name = name
         self.max_resonance = max_resonance # Maximum "health"
         self.current_resonance = max_resonance # Current "health"
         self.status_effects = {} # e.g., {"Tempo": 2} turns remaining
+        self.positive_effect_count = 0 # Active effects whose kind is in POSITIVE_EFFECTS
+        self.regen_per_tick = 0 # Sum of N over active Resonance_N effects, parsed once when added
         self.position = 0 # Placeholder for positional logic
 
     # Modified to accept renderer
     def take_damage(self, amount, renderer: AbstractRenderer):
         """Applies damage (reduces resonance), checking for Guard."""
         if "Guard" in self.status_effects:
-            renderer.display_message(f"{self.name} has Guard! Damage blocked.")
+            if renderer.enabled: renderer.display_message(f"{self.name} has Guard! Damage blocked.")
             del self.status_effects["Guard"]
+            self._track_effect("Guard", -1)
             return False
 
         actual_damage = amount
         if actual_damage < 0: actual_damage = 0
 
         self.current_resonance -= actual_damage
-        renderer.display_message(f"{self.name} takes {actual_damage} damage, {self.current_resonance}/{self.max_resonance} Resonance remaining.")
+        if renderer.enabled: renderer.display_message(f"{self.name} takes {actual_damage} damage, {self.current_resonance}/{self.max_resonance} Resonance remaining.")
         if self.current_resonance <= 0:
             self.current_resonance = 0
-            renderer.display_message(f"{self.name} is broken!")
+            if renderer.enabled: renderer.display_message(f"{self.name} is broken!")
         return self.current_resonance <= 0
 
     # Modified to accept renderer
     def heal(self, amount, renderer: AbstractRenderer):
         """Restores resonance."""
         if self.current_resonance <= 0:
-            renderer.display_message(f"{self.name} is broken and cannot be healed.")
+            if renderer.enabled: renderer.display_message(f"{self.name} is broken and cannot be healed.")
             return 0
 
         actual_heal = amount
@@ -46,15 +56,31 @@ class Tool:
              return 0
 
         self.current_resonance += healed_amount
-        renderer.display_message(f"{self.name} restores {healed_amount} Resonance, now at {self.current_resonance}/{self.max_resonance}.")
+        if renderer.enabled: renderer.display_message(f"{self.name} restores {healed_amount} Resonance, now at {self.current_resonance}/{self.max_resonance}.")
         return healed_amount
 
     # Modified to accept renderer
     def add_status_effect(self, effect_name, duration, renderer: AbstractRenderer):
         """Adds a status effect."""
         # TODO: Handle stacking/refreshing logic
+        if effect_name not in self.status_effects: # Refreshing an effect doesn't count twice
+            self._track_effect(effect_name, 1)
         self.status_effects[effect_name] = duration
-        renderer.display_message(f"{self.name} gains {effect_name} for {duration} turns.")
+        if renderer.enabled: renderer.display_message(f"{self.name} gains {effect_name} for {duration} turns.")
+
+    def clear_status_effects(self):
+        """Removes all status effects, resetting the cached effect counters with them."""
+        self.status_effects.clear()
+        self.positive_effect_count = 0
+        self.regen_per_tick = 0
+
+    def _track_effect(self, effect_name, sign):
+        """Updates the cached effect counters when an effect is added (+1) or removed (-1)."""
+        kind, magnitude = split_effect_key(effect_name)
+        if kind in POSITIVE_EFFECTS:
+            self.positive_effect_count += sign
+        if kind == "Resonance":
+            self.regen_per_tick += sign * magnitude
 
     # Modified to accept renderer
     def tick_status_effects(self, renderer: AbstractRenderer):
@@ -66,15 +92,11 @@ class Tool:
             # renderer.display_message("  No active effects.")
             return
 
-        for effect, duration in list(self.status_effects.items()):
-            if effect.startswith("Resonance_"):
-                try:
-                    heal_amount = int(effect.split("_")[1])
-                    # renderer.display_message(f"  Applying {effect}: Healing for {heal_amount}.")
-                    self.heal(heal_amount, renderer) # Pass renderer
-                except (IndexError, ValueError):
-                    renderer.display_message(f"  Error parsing Resonance effect: {effect}")
+        if self.regen_per_tick:
+            # Resonance_N magnitudes were summed when added, so no key parsing here
+            self.heal(self.regen_per_tick, renderer) # Pass renderer
 
+        for effect, duration in list(self.status_effects.items()):
             # TODO: Apply other status effect logic (Tempo, Dissonance, etc.)
 
             if duration > 0:
@@ -86,8 +108,9 @@ class Tool:
                     expired_effects.append(effect)
 
         for effect in expired_effects:
-            renderer.display_message(f"  {effect} on {self.name} has expired.")
+            if renderer.enabled: renderer.display_message(f"  {effect} on {self.name} has expired.")
             del self.status_effects[effect]
+            self._track_effect(effect, -1)
 
     def __str__(self):
         # Basic representation, can be enhanced by UI renderer
@@ -98,14 +121,20 @@ class Tool:
 # --- Specific Tool Definitions ---
 
 class ResonantGourd(Tool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Resonant Gourd", max_resonance=50) # Example health value
 
 class SteadyDrum(Tool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Steady Drum", max_resonance=60) # Slightly higher health example
 
 class TunedPanpipes(Tool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Tuned Panpipes", max_resonance=45) # Lower health example
         # TODO: Implement enhancement for Harmony cards played through it
@@ -2,6 +2,12 @@
 # This allows the core game logic to interact with different UI implementations (CLI, GUI)
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import string
+from ..actions import Action # No imports of its own, so safe from cycles
+
+# Tools are labelled A, B, C... for targeting; index i gets TOOL_LETTERS[i]
+TOOL_LETTERS = string.ascii_uppercase
 
 # Forward declarations for type hinting if needed (or import specific types)
 # from ..game_state import GameState # Avoid circular imports if possible
@@ -11,11 +17,34 @@ from abc import ABC, abstractmethod
 class AbstractRenderer(ABC):
     """Abstract base class for rendering game information."""
 
+    # False for sinks that discard output, so callers can skip formatting messages nobody sees
+    enabled: bool = True
+
     @abstractmethod
     def display_message(self, message: str):
         """Displays a generic message to the user."""
         pass
 
+    def begin_frame(self):
+        """Starts a frame: messages displayed until the matching end_frame may be held back and emitted together.
+
+        The default shows messages as they arrive; renderers with per-call output costs override both methods.
+        """
+        pass
+
+    def end_frame(self):
+        """Ends the frame opened by begin_frame, emitting anything held back."""
+        pass
+
+    @contextmanager
+    def batch(self):
+        """Runs the block as one frame. Never wrap code that prompts for input: held-back output would lag the prompt."""
+        self.begin_frame()
+        try:
+            yield
+        finally:
+            self.end_frame()
+
     @abstractmethod
     def display_combat_state(self, player, ailments):
         """Displays the current state of combat (player tools, ailments, etc.)."""
@@ -78,7 +107,7 @@ class AbstractInputHandler(ABC):
         pass
 
     @abstractmethod
-    def get_combat_action(self, player, active_ailments) -> tuple[str, dict]:
+    def get_combat_action(self, player, active_ailments) -> tuple[Action, dict]:
         """Gets the player's action choice during combat."""
         pass
 
@@ -1,52 +1,93 @@
 # Concrete CLI implementation of the AbstractRenderer
 
-from .abstract_ui import AbstractRenderer
+import sys
+from collections import Counter
+from .abstract_ui import AbstractRenderer, TOOL_LETTERS
 # Import necessary game objects for type hinting or displaying attributes
 from ..characters import PlayerCharacter
 from ..ailments import Ailment
 from ..shop import Shop
 from ..game_state import Patient
 
+# Synchronized-update brackets: terminals that support them show the frame all at once, others ignore them
+SYNC_UPDATE_BEGIN = "\x1b[?2026h"
+SYNC_UPDATE_END = "\x1b[?2026l"
+
 class CLIRenderer(AbstractRenderer):
-    """Renders game information to the command line."""
+    """Renders game information to the command line.
+    Multi-line views (combat state, deck, dice, items, shop) run inside batch(), so each reaches stdout as one write."""
+
+    def __init__(self):
+        self._batched_lines = None # Messages held back while a frame is open
+        self._frame_depth = 0 # Nesting level of begin_frame calls
 
     def display_message(self, message: str):
-        print(message)
+        if self._batched_lines is not None:
+            self._batched_lines.append(message)
+        else:
+            print(message)
+
+    def begin_frame(self):
+        """Starts holding display_message output back until the matching end_frame. Frames nest."""
+        if self._frame_depth == 0:
+            self._batched_lines = []
+        self._frame_depth += 1
+
+    def end_frame(self):
+        """Closes a frame; the outermost one writes everything held back in a single write."""
+        self._frame_depth -= 1
+        if self._frame_depth == 0:
+            lines, self._batched_lines = self._batched_lines, None
+            if lines:
+                self._write_frame("\n".join(lines))
+
+    @staticmethod
+    def _write_frame(text):
+        """Writes one frame of text, bracketed as a synchronized update when stdout is a terminal."""
+        out = sys.stdout
+        if out.isatty():
+            out.write(f"{SYNC_UPDATE_BEGIN}{text}\n{SYNC_UPDATE_END}")
+        else:
+            out.write(text + "\n")
+        out.flush()
 
     def display_combat_state(self, player: PlayerCharacter, ailments: list[Ailment]):
-        print("\n" + "="*10 + " Combat State " + "="*10)
+        # The panel is composed as one frame and written in a single call, not line by line
+        lines = ["\n" + "="*10 + " Combat State " + "="*10]
+        add = lines.append
         # Display Player Tools (A, B, C...)
-        print("Your Tools:")
+        add("Your Tools:")
         if not player.tools:
-            print("  None")
+            add("  None")
         else:
-            for i, tool in enumerate(player.tools):
-                tool_letter = chr(ord('A') + i)
+            for tool_letter, tool in zip(TOOL_LETTERS, player.tools):
                 status_str = ", ".join(f"{k}({v})" for k, v in tool.status_effects.items())
                 status_display = f" [{status_str}]" if status_str else ""
-                print(f"  {tool_letter}. {tool.name} ({tool.current_resonance}/{tool.max_resonance} Res){status_display}")
+                add(f"  {tool_letter}. {tool.name} ({tool.current_resonance}/{tool.max_resonance} Res){status_display}")
 
         # Display Ailments (1, 2, 3...)
-        print("\nAilments:")
+        add("\nAilments:")
         if not ailments:
-            print("  None")
+            add("  None")
         else:
             for i, ailment in enumerate(ailments):
                 status_str = ", ".join(f"{k}({v})" for k, v in ailment.status_effects.items())
                 status_display = f" [{status_str}]" if status_str else ""
                 # TODO: Display ailment intent if available
-                print(f"  {i+1}. {ailment.name} ({ailment.current_resonance}/{ailment.max_resonance} Res){status_display}")
+                add(f"  {i+1}. {ailment.name} ({ailment.current_resonance}/{ailment.max_resonance} Res){status_display}")
 
         # Display Player Hand
-        print("\nYour Hand:")
+        add("\nYour Hand:")
         if not player.hand:
-            print("  Empty")
+            add("  Empty")
         else:
             for i, card in enumerate(player.hand):
-                print(f"  {i+1}. {card}") # Uses card.__str__
+                add(f"  {i+1}. {card}") # Uses card.__str__
 
-        print(f"\nAP: {player.current_ap}/{player.max_ap}")
-        print("="*34)
+        add(f"\nAP: {player.current_ap}/{player.max_ap}")
+        add("="*34)
+        with self.batch(): # Its own frame, or part of an already open one
+            self.display_message("\n".join(lines))
 
     def display_player_status(self, player: PlayerCharacter):
         # Basic status for now
@@ -54,79 +95,76 @@ class CLIRenderer(AbstractRenderer):
         # Could add more here later (deck size, discard size, etc.)
 
     def display_deck(self, player: PlayerCharacter):
-        print("\n--- Your Deck ---")
-        if not player.card_collection: # Show full collection for now
-            print("  Empty")
-        else:
-            # Group identical cards?
-            counts = {}
-            for card in player.card_collection:
-                 counts[str(card)] = counts.get(str(card), 0) + 1
-            for card_str, count in counts.items():
-                 print(f"  {card_str} x{count}")
-        print("-" * 17)
+        with self.batch():
+            self.display_message("\n--- Your Deck ---")
+            if not player.card_collection: # Show full collection for now
+                self.display_message("  Empty")
+            else:
+                # Group identical cards; one str() per card, first-seen order kept
+                counts = Counter(map(str, player.card_collection))
+                self.display_message("\n".join(f"  {card_str} x{count}" for card_str, count in counts.items()))
+            self.display_message("-" * 17)
 
     def display_dice(self, player: PlayerCharacter):
-        print("\n--- Your Dice ---")
-        print("Loadout:")
-        if not player.dice_loadout:
-            print("  Empty")
-        else:
-            for i, die in enumerate(player.dice_loadout):
-                print(f"  Slot {i+1}: {die}") # Uses die.__str__
-        print("\nCollection:")
-        if not player.dice_collection:
-             print("  Empty")
-        else:
-             # Group identical dice?
-             counts = {}
-             for die in player.dice_collection:
-                  counts[str(die)] = counts.get(str(die), 0) + 1
-             for die_str, count in counts.items():
-                  print(f"  {die_str} x{count}")
-        print("-" * 17)
+        with self.batch():
+            self.display_message("\n--- Your Dice ---")
+            self.display_message("Loadout:")
+            if not player.dice_loadout:
+                self.display_message("  Empty")
+            else:
+                self.display_message("\n".join(f"  Slot {i+1}: {die}" for i, die in enumerate(player.dice_loadout))) # Uses die.__str__
+            self.display_message("\nCollection:")
+            if not player.dice_collection:
+                 self.display_message("  Empty")
+            else:
+                 # Group identical dice; one str() per die, first-seen order kept
+                 counts = Counter(map(str, player.dice_collection))
+                 self.display_message("\n".join(f"  {die_str} x{count}" for die_str, count in counts.items()))
+            self.display_message("-" * 17)
 
     def display_items(self, player: PlayerCharacter):
-        print("\n--- Your Items ---")
-        print("Equipment:")
-        equipped_something = False
-        for i, item in enumerate(player.equipment):
-            if item:
-                print(f"  Slot {i+1}: {item}") # Uses item.__str__
-                equipped_something = True
-        if not equipped_something:
-            print("  None Equipped")
-
-        print("\nConsumables:")
-        if not player.consumables:
-            print("  None")
-        else:
-            for name, quantity in player.consumables.items():
-                # Find the item object to display its description
-                item_obj = next((item for item in player.item_collection if item.name == name), None)
-                desc = item_obj.description if item_obj else "???"
-                print(f"  {name} x{quantity} - {desc}")
-        print("-" * 18)
+        with self.batch():
+            self.display_message("\n--- Your Items ---")
+            self.display_message("Equipment:")
+            equipped_something = False
+            for i, item in enumerate(player.equipment):
+                if item:
+                    self.display_message(f"  Slot {i+1}: {item}") # Uses item.__str__
+                    equipped_something = True
+            if not equipped_something:
+                self.display_message("  None Equipped")
+
+            self.display_message("\nConsumables:")
+            if not player.consumables:
+                self.display_message("  None")
+            else:
+                for name, quantity in player.consumables.items():
+                    # Find the item object to display its description
+                    item_obj = player.item_by_name.get(name)
+                    desc = item_obj.description if item_obj else "???"
+                    self.display_message(f"  {name} x{quantity} - {desc}")
+            self.display_message("-" * 18)
 
     def display_shop_inventory(self, shop: Shop):
-        print("\n--- Shop Inventory ---")
-        print("Cards for Sale:")
-        if not shop.inventory_cards: print("  None")
-        # TODO: Display cards with prices
-
-        print("\nItems for Sale:")
-        if not shop.inventory_items:
-            print("  None")
-        else:
-            for i, item in enumerate(shop.inventory_items):
-                 cost = getattr(item, 'cost', 'N/A')
-                 print(f"  {i+1}. {item} (Cost: {cost})")
-
-        print("\nDice for Sale:")
-        if not shop.inventory_dice: print("  None")
-        # TODO: Display dice with prices
-
-        print(f"\nCard Enhancement Cost: {shop.card_enhancement_cost} Currency (approx)")
+        with self.batch():
+            self.display_message("\n--- Shop Inventory ---")
+            self.display_message("Cards for Sale:")
+            if not shop.inventory_cards: self.display_message("  None")
+            # TODO: Display cards with prices
+
+            self.display_message("\nItems for Sale:")
+            if not shop.inventory_items:
+                self.display_message("  None")
+            else:
+                for i, item in enumerate(shop.inventory_items):
+                     cost = getattr(item, 'cost', 'N/A')
+                     self.display_message(f"  {i+1}. {item} (Cost: {cost})")
+
+            self.display_message("\nDice for Sale:")
+            if not shop.inventory_dice: self.display_message("  None")
+            # TODO: Display dice with prices
+
+            self.display_message(f"\nCard Enhancement Cost: {shop.card_enhancement_cost} Currency (approx)")
 
     def display_available_patients(self, patients: list[Patient]):
          # This is handled by get_player_choice in the CLI version
@@ -0,0 +1,19 @@
+# Headless implementation of the AbstractRenderer (simulations, AI playouts)
+
+from .abstract_ui import AbstractRenderer
+
+class NullRenderer(AbstractRenderer):
+    """Discards all output. enabled is False, so game logic skips building messages."""
+    enabled = False
+
+    def display_message(self, message: str): pass
+    def display_combat_state(self, player, ailments): pass
+    def display_player_status(self, player): pass
+    def display_deck(self, player): pass
+    def display_dice(self, player): pass
+    def display_items(self, player): pass
+    def display_shop_inventory(self, shop): pass
+    def display_available_patients(self, patients): pass
+    def display_omen_options(self, text: str, options: list[str]): pass
+    def display_dice_roll(self, roll_values: list[int]): pass
+    def display_dice_scores(self, possible_scores: list): pass
@@ -0,0 +1,6 @@
+# Shared pytest setup for the Chromatic Glitch tests
+import sys
+import os
+
+# Add project root to sys.path once for the whole session, so test modules can import chromatic_glitch and tests.mocks
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
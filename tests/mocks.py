@@ -1,20 +1,28 @@
 # Mock objects for testing core logic without real UI interaction
+import random
+from collections import deque
 
 from chromatic_glitch.ui.abstract_ui import AbstractRenderer, AbstractInputHandler
 from chromatic_glitch.characters import PlayerCharacter # For type hints
 from chromatic_glitch.ailments import Ailment # For type hints
 from chromatic_glitch.shop import Shop # For type hints
 from chromatic_glitch.game_state import Patient # For type hints
+from chromatic_glitch.actions import Action
 
 class MockRenderer(AbstractRenderer):
-    """A mock renderer that captures messages instead of printing."""
-    def __init__(self):
-        self.messages = []
+    """A mock renderer that captures messages instead of printing.
+    Only the last max_messages are kept, so long runs use bounded memory; pass None to keep every message."""
+    def __init__(self, max_messages=10000):
+        self.messages = deque(maxlen=max_messages) # Oldest messages drop off the front once full
 
     def display_message(self, message: str):
         self.messages.append(message)
         # print(f"[MockRender]: {message}") # Optional: uncomment for debug visibility
 
+    def contains(self, text: str) -> bool:
+        """True if any retained message contains text. Checks each message in place instead of joining the transcript."""
+        return any(text in message for message in self.messages)
+
     # Implement other methods as needed, potentially just passing or logging calls
     def display_combat_state(self, player, ailments): pass
     def display_player_status(self, player): pass
@@ -27,20 +35,48 @@ class MockRenderer(AbstractRenderer):
     def display_dice_roll(self, roll_values: list[int]): pass
     def display_dice_scores(self, possible_scores: list): pass
 
+_NO_PRESET = object() # Distinguishes "no preset" from presets whose value is falsy (0, False)
+
 class MockInputHandler(AbstractInputHandler):
     """A mock input handler that returns predefined responses."""
     def __init__(self):
-        self.preset_choices = {} # Map prompt to choice index/value
-        self.preset_confirmations = {} # Map prompt to True/False
-        self.preset_dice_actions = [] # List of ('action_type', data) tuples
-        self.preset_reroll_choices = [] # List of True/False
+        self.preset_choices = {} # Map prompt substring to choice index/value
+        self.preset_confirmations = {} # Map prompt substring to True/False
+        self.exact_choices = {} # Map whole prompt to choice index/value; checked before the substring presets
+        self.exact_confirmations = {} # Map whole prompt to True/False
+        self.preset_dice_actions = deque() # ('action_type', data) tuples, consumed from the front
+        self.preset_reroll_choices = deque() # True/False, consumed from the front
+        self._preset_key_cache = {} # (id(presets), prompt) -> matching key or None; cleared when presets change
 
     # --- Methods to preset responses ---
-    def set_choice(self, prompt_substring, choice_index):
-        self.preset_choices[prompt_substring] = choice_index
-
-    def set_confirmation(self, prompt_substring, value: bool):
-        self.preset_confirmations[prompt_substring] = value
+    # match_type="exact" only answers that exact prompt, found by hashing; "sub" (default) matches any prompt containing it
+    def set_choice(self, prompt_substring, choice_index, match_type="sub"):
+        if match_type == "exact":
+            self.exact_choices[prompt_substring] = choice_index
+        else:
+            self.preset_choices[prompt_substring] = choice_index
+            self._preset_key_cache.clear()
+
+    def set_confirmation(self, prompt_substring, value: bool, match_type="sub"):
+        if match_type == "exact":
+            self.exact_confirmations[prompt_substring] = value
+        else:
+            self.preset_confirmations[prompt_substring] = value
+            self._preset_key_cache.clear()
+
+    def _find_preset(self, exact, presets, prompt):
+        """Returns the preset value for prompt, or _NO_PRESET. Exact presets are one dict lookup;
+        substring presets are scanned once per prompt per preset change."""
+        value = exact.get(prompt, _NO_PRESET)
+        if value is not _NO_PRESET:
+            return value
+        cache_key = (id(presets), prompt)
+        try:
+            key = self._preset_key_cache[cache_key]
+        except KeyError:
+            key = next((k for k in presets if k in prompt), None)
+            self._preset_key_cache[cache_key] = key
+        return _NO_PRESET if key is None else presets[key]
 
     def add_dice_action(self, action_type: str, data: dict | None = None):
         self.preset_dice_actions.append((action_type, data))
@@ -50,41 +86,41 @@ class MockInputHandler(AbstractInputHandler):
 
     # --- Abstract Method Implementations ---
     def get_player_choice(self, prompt: str, options: list[str]) -> tuple[int, str]:
-        for key, index in self.preset_choices.items():
-            if key in prompt:
-                if 0 <= index < len(options):
-                    # print(f"[MockInput] Choice for '{prompt}': {index+1} -> {options[index]}")
-                    return index, options[index]
+        index = self._find_preset(self.exact_choices, self.preset_choices, prompt)
+        if index is not _NO_PRESET:
+            if 0 <= index < len(options):
+                # print(f"[MockInput] Choice for '{prompt}': {index+1} -> {options[index]}")
+                return index, options[index]
         # Default or error if no preset match
         print(f"[MockInput] WARN: No preset choice for prompt: {prompt}")
         return 0, options[0] # Default to first option
 
-    def get_combat_action(self, player, active_ailments) -> tuple[str, dict]:
+    def get_combat_action(self, player, active_ailments) -> tuple[Action, dict]:
         # Needs more sophisticated presets if used in complex tests
         print("[MockInput] WARN: get_combat_action not fully mocked.")
-        return "END_TURN", {} # Default to ending turn
+        return Action.END_TURN, {} # Default to ending turn
 
     def get_target_index(self, prompt: str, max_index: int, allow_cancel=True) -> int | None:
-        for key, index in self.preset_choices.items():
-            if key in prompt:
-                # print(f"[MockInput] Target Index for '{prompt}': {index+1}")
-                return index
+        index = self._find_preset(self.exact_choices, self.preset_choices, prompt)
+        if index is not _NO_PRESET:
+            # print(f"[MockInput] Target Index for '{prompt}': {index+1}")
+            return index
         print(f"[MockInput] WARN: No preset target index for prompt: {prompt}")
         return 0 # Default to first target
 
     def get_target_index_alpha(self, prompt: str, max_count: int, allow_cancel=True) -> int | None:
-        for key, index in self.preset_choices.items():
-             if key in prompt:
-                  # print(f"[MockInput] Target Index Alpha for '{prompt}': {chr(ord('A')+index)}")
-                  return index
+        index = self._find_preset(self.exact_choices, self.preset_choices, prompt)
+        if index is not _NO_PRESET:
+            # print(f"[MockInput] Target Index Alpha for '{prompt}': {chr(ord('A')+index)}")
+            return index
         print(f"[MockInput] WARN: No preset alpha target index for prompt: {prompt}")
         return 0 # Default to first target
 
     def confirm_action(self, prompt: str) -> bool:
-        for key, value in self.preset_confirmations.items():
-            if key in prompt:
-                # print(f"[MockInput] Confirmation for '{prompt}': {value}")
-                return value
+        value = self._find_preset(self.exact_confirmations, self.preset_confirmations, prompt)
+        if value is not _NO_PRESET:
+            # print(f"[MockInput] Confirmation for '{prompt}': {value}")
+            return value
         print(f"[MockInput] WARN: No preset confirmation for prompt: {prompt}")
         return True # Default to True
 
@@ -94,7 +130,7 @@ class MockInputHandler(AbstractInputHandler):
 
     def get_dice_to_set_aside(self, possible_scores: list, can_reroll: bool, reroll_options: list) -> tuple[str, dict | None]:
         if self.preset_dice_actions:
-            action = self.preset_dice_actions.pop(0)
+            action = self.preset_dice_actions.popleft()
             # print(f"[MockInput] Dice Action: {action}")
             return action
         print("[MockInput] WARN: No preset dice action, stopping round.")
@@ -102,7 +138,7 @@ class MockInputHandler(AbstractInputHandler):
 
     def get_dice_reroll_choice(self) -> bool:
         if self.preset_reroll_choices:
-            choice = self.preset_reroll_choices.pop(0)
+            choice = self.preset_reroll_choices.popleft()
             # print(f"[MockInput] Reroll Choice: {choice}")
             return choice
         print("[MockInput] WARN: No preset reroll choice, choosing 'n'.")
@@ -114,6 +150,8 @@ class MockGameState:
         self.renderer = MockRenderer()
         self.input_handler = MockInputHandler()
         self.player_character = None # Tests should set this
+        self.shop = None # Created by enter_shop on first visit
+        self.rng = random.Random(0) # Fixed seed so anything drawing from the run RNG is repeatable
         # Add other state attributes if needed by the methods being tested
         self.current_phase = "TEST"
 
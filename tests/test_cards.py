@@ -1,25 +1,19 @@
 import unittest
-import sys
-import os
-
-# Add project root to sys.path to allow importing chromatic_glitch modules
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-
-# Add project root to sys.path to allow importing chromatic_glitch modules
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
 
 # Import all necessary cards and character data functions
 from chromatic_glitch.cards import (
     Strike, Mend, Guard, ForcefulNote, KaelensResolve, SteadyRhythm,
-    EchoingShout, HarmonicPulse, LyrasInsight, Soothe # Added missing imports
+    EchoingShout, HarmonicPulse, LyrasInsight, Soothe, # Added missing imports
+    Card, CardType, STRIKE # STRIKE is the shared instance starting decks hold; drawing never changes it, so it also fills dummy decks
 )
 from chromatic_glitch.characters import PlayerCharacter, get_kaelen_data, get_lyra_data # Added get_lyra_data
-from chromatic_glitch.ailments import Ailment, CrawlingAnxiety, SensorySpike # Added SensorySpike for test
-from chromatic_glitch.tools import Tool, ResonantGourd, SteadyDrum # Added SteadyDrum for test
+from chromatic_glitch.ailments import CrawlingAnxiety, SensorySpike, IntentAction # Added SensorySpike for test
+from chromatic_glitch.tools import SteadyDrum # Added SteadyDrum for test
 # Import mock game state using absolute path from project root
 from tests.mocks import MockGameState
+from chromatic_glitch.ui.null_renderer import NullRenderer
+from chromatic_glitch.ui.cli_input_handler import CLIInputHandler
+from unittest import mock
 
 class TestCardEffects(unittest.TestCase):
 
@@ -32,7 +26,7 @@ class TestCardEffects(unittest.TestCase):
         # Ensure target tool exists and reset resonance for tests
         self.target_tool = self.player.tools[0]
         self.target_tool.current_resonance = self.target_tool.max_resonance
-        self.target_tool.status_effects = {} # Ensure clean status effects
+        self.target_tool.clear_status_effects() # Ensure clean status effects
 
     def test_strike_card(self):
         """Test the Strike card deals correct Soothe."""
@@ -46,8 +40,8 @@ class TestCardEffects(unittest.TestCase):
     def test_mend_card(self):
         """Test the Mend card restores correct Resonance."""
         mend = Mend()
-        # Damage the tool first (take_damage needs renderer)
-        self.target_tool.take_damage(10, self.game_state.renderer)
+        # Damage the tool first so Mend has something to restore
+        self.target_tool.current_resonance -= 10
         initial_resonance = self.target_tool.current_resonance
         # Pass game_state to execute
         mend.execute(self.player, self.target_tool, self.game_state)
@@ -64,109 +58,50 @@ class TestCardEffects(unittest.TestCase):
         self.assertIn("Guard", self.target_tool.status_effects)
         self.assertEqual(self.target_tool.status_effects["Guard"], guard.status_effect_duration)
 
-    def test_forceful_note_no_dice(self):
-        """Test Forceful Note base damage without dice score."""
-        card = ForcefulNote()
-        initial_resonance = self.target_ailment.current_resonance
-        # Pass game_state to execute
-        card.execute(self.player, self.target_ailment, self.game_state, dice_score=0)
-        self.assertEqual(self.target_ailment.current_resonance, initial_resonance - card.soothe_amount)
-
-    def test_forceful_note_with_dice(self):
-        """Test Forceful Note bonus damage with dice score."""
-        card = ForcefulNote()
-        dice_score = 550 # Example score > 0
-        bonus_soothe = dice_score // 50
-        initial_resonance = self.target_ailment.current_resonance
-        # Pass game_state to execute
-        card.execute(self.player, self.target_ailment, self.game_state, dice_score=dice_score)
-        expected_damage = card.soothe_amount + bonus_soothe
-        # Ensure expected resonance doesn't go below 0
-        expected_resonance = max(0, initial_resonance - expected_damage)
-        self.assertEqual(self.target_ailment.current_resonance, expected_resonance)
-
-    def test_kaelens_resolve_low_score(self):
-        """Test Kaelen's Resolve deals damage on low score."""
-        card = KaelensResolve()
-        dice_score = 50 # Low score <= 100
-        initial_tool_res = self.target_tool.current_resonance
-        # Execute affects the first tool
-        card.execute(self.player, None, self.game_state, dice_score=dice_score)
-        self.assertEqual(self.target_tool.current_resonance, initial_tool_res - 2) # Expect 2 damage
-
-    def test_kaelens_resolve_high_score(self):
-        """Test Kaelen's Resolve heals on high score."""
-        card = KaelensResolve()
-        dice_score = 450 # High score > 100
-        heal_amount = dice_score // 100 # 4
-        # Damage tool first so heal has effect
-        self.target_tool.take_damage(10, self.game_state.renderer)
-        initial_tool_res = self.target_tool.current_resonance
-        # Execute affects the first tool
-        card.execute(self.player, None, self.game_state, dice_score=dice_score)
-        expected_res = min(initial_tool_res + heal_amount, self.target_tool.max_resonance)
-        self.assertEqual(self.target_tool.current_resonance, expected_res)
-
-    def test_steady_rhythm_low_score(self):
-        """Test Steady Rhythm grants no AP on low score."""
-        card = SteadyRhythm()
-        dice_score = 250 # Low score <= 300
-        self.player.next_turn_effects = {} # Ensure no pre-existing effects
-        card.execute(self.player, None, self.game_state, dice_score=dice_score)
-        self.assertNotIn("BonusAP", self.player.next_turn_effects)
-
-    def test_steady_rhythm_high_score(self):
-        """Test Steady Rhythm grants +1 AP on high score."""
-        card = SteadyRhythm()
-        dice_score = 350 # High score > 300
-        self.player.next_turn_effects = {} # Ensure no pre-existing effects
-        card.execute(self.player, None, self.game_state, dice_score=dice_score)
-        self.assertIn("BonusAP", self.player.next_turn_effects)
-        self.assertEqual(self.player.next_turn_effects["BonusAP"], 1)
-
-    def test_lyras_insight_no_buff(self):
-        """Test Lyra's Insight draws 1 card when no tool has buffs."""
-        # Need Lyra's deck for this card
-        self.player = PlayerCharacter(**get_lyra_data()) # Re-init player as Lyra
-        self.game_state.player_character = self.player
-        self.target_tool = self.player.tools[0]
-        self.target_tool.status_effects = {} # Ensure no buffs
-
-        card = LyrasInsight()
-        initial_hand_size = len(self.player.hand)
-        # Ensure deck has cards
-        self.player.deck = [Strike(), Strike(), Strike()] # Add dummy cards
-
-        card.execute(self.player, None, self.game_state)
-        self.assertEqual(len(self.player.hand), initial_hand_size + 1) # Drew 1 card
-
-    def test_lyras_insight_with_buff(self):
-        """Test Lyra's Insight draws 2 cards when a tool has buffs."""
-        self.player = PlayerCharacter(**get_lyra_data()) # Re-init player as Lyra
-        self.game_state.player_character = self.player
-        self.target_tool = self.player.tools[0]
-        # Give tool a buff
-        self.target_tool.add_status_effect("Guard", 1, self.game_state.renderer)
-
-        card = LyrasInsight()
-        initial_hand_size = len(self.player.hand)
-        # Ensure deck has cards
-        self.player.deck = [Strike(), Strike(), Strike()] # Add dummy cards
-
-        card.execute(self.player, None, self.game_state)
-        self.assertEqual(len(self.player.hand), initial_hand_size + 2) # Drew 2 cards
+    def test_forceful_note(self):
+        """Test Forceful Note deals its base Soothe plus Score/50 from the dice game."""
+        for dice_score in (0, 550):
+            with self.subTest(dice_score=dice_score):
+                card = ForcefulNote()
+                target = CrawlingAnxiety() # Fresh target per case
+                initial_resonance = target.current_resonance
+                card.execute(self.player, target, self.game_state, dice_score=dice_score)
+                expected_damage = card.soothe_amount + dice_score // 50
+                # Ensure expected resonance doesn't go below 0
+                self.assertEqual(target.current_resonance, max(0, initial_resonance - expected_damage))
+
+    def test_kaelens_resolve(self):
+        """Test Kaelen's Resolve deals 2 damage on a low score and heals Score/100 on a high one."""
+        for dice_score, expected_change in ((50, -2), (450, 450 // 100)): # Threshold is 100
+            with self.subTest(dice_score=dice_score):
+                # Damage tool first so a heal isn't capped at max
+                self.target_tool.current_resonance = self.target_tool.max_resonance - 10
+                initial_tool_res = self.target_tool.current_resonance
+                # Execute affects the first tool
+                KaelensResolve().execute(self.player, None, self.game_state, dice_score=dice_score)
+                self.assertEqual(self.target_tool.current_resonance, initial_tool_res + expected_change)
+
+    def test_steady_rhythm(self):
+        """Test Steady Rhythm grants +1 AP next turn only on a score above 300."""
+        for dice_score, expected_bonus in ((250, None), (350, 1)):
+            with self.subTest(dice_score=dice_score):
+                self.player.next_turn_effects = {} # Ensure no pre-existing effects
+                SteadyRhythm().execute(self.player, None, self.game_state, dice_score=dice_score)
+                self.assertEqual(self.player.next_turn_effects.get("BonusAP"), expected_bonus) # None: not granted at all
+
+    def test_dice_bonus_helpers(self):
+        """Test the per-card dice bonus helpers match what execute applies."""
+        scores = [0, 100, 101, 300, 301, 550]
+        self.assertEqual([ForcefulNote.dice_bonus(s) for s in scores], [0, 2, 2, 6, 6, 11])
+        self.assertEqual([SteadyRhythm.dice_bonus(s) for s in scores], [0, 0, 0, 0, 1, 1])
+        self.assertEqual([KaelensResolve.dice_bonus(s) for s in scores], [-2, -2, 1, 3, 3, 5])
 
     def test_echoing_shout(self):
         """Test Echoing Shout hits the first two ailments."""
         card = EchoingShout()
-        # Ensure ailments have full health for consistent testing
-        ailment1 = CrawlingAnxiety()
-        ailment1.current_resonance = ailment1.max_resonance
-        ailment2 = SensorySpike()
-        ailment2.current_resonance = ailment2.max_resonance
-        ailment3 = CrawlingAnxiety()
-        ailment3.current_resonance = ailment3.max_resonance
-        active_ailments = [ailment1, ailment2, ailment3]
+        # Fresh ailments start at full resonance
+        active_ailments = [CrawlingAnxiety(), SensorySpike(), CrawlingAnxiety()]
+        ailment1, ailment2, ailment3 = active_ailments
 
         initial_res1 = ailment1.current_resonance
         initial_res2 = ailment2.current_resonance
@@ -179,6 +114,40 @@ class TestCardEffects(unittest.TestCase):
         self.assertEqual(ailment2.current_resonance, initial_res2 - card.soothe_amount)
         self.assertEqual(ailment3.current_resonance, initial_res3) # Third ailment should be unaffected
 
+    def test_echoing_shout_tuple_front_two(self):
+        """Test Echoing Shout accepts a tuple and stops after the front two ailments."""
+        card = EchoingShout()
+        ailments = (CrawlingAnxiety(), CrawlingAnxiety(), CrawlingAnxiety())
+        card.execute(self.player, ailments, self.game_state)
+        self.assertEqual([a.current_resonance for a in ailments],
+                         [a.max_resonance - card.soothe_amount for a in ailments[:2]] + [ailments[2].max_resonance])
+        self.assertIn("Targeting: ['Crawling Anxiety', 'Crawling Anxiety']", self.game_state.renderer.messages)
+
+    def test_echoing_shout_single_ailment(self):
+        """Test Echoing Shout reports an error instead of failing when given a lone Ailment."""
+        card = EchoingShout()
+        card.execute(self.player, self.target_ailment, self.game_state)
+        self.assertEqual(self.target_ailment.current_resonance, self.target_ailment.max_resonance)
+        self.assertIn("Error: Echoing Shout target must be a list of ailments.", self.game_state.renderer.messages)
+
+    def test_aoe_targets(self):
+        """Test AoE cards pick their own targets and single-target cards report none."""
+        ailments = [CrawlingAnxiety(), SensorySpike()]
+        self.assertIs(EchoingShout().get_aoe_targets(self.player, ailments), ailments)
+        self.assertIs(HarmonicPulse().get_aoe_targets(self.player, ailments), self.player.tools)
+        self.assertIsNone(Strike().get_aoe_targets(self.player, ailments))
+
+    def test_cli_targets_enhanced_aoe_card_automatically(self):
+        """Test the CLI asks the card, not its name, whether it picks its own targets."""
+        self.player.hand = [HarmonicPulse().enhanced_copy(self.game_state.renderer), SteadyRhythm()]
+        handler = CLIInputHandler()
+        for card_number, expected_target in (("1", -2), ("2", -1)): # Harmonic Pulse+: AoE; Steady Rhythm: self
+            with self.subTest(card=self.player.hand[int(card_number) - 1].name):
+                # Menu choice "Play Card", then the card number
+                with mock.patch.object(handler, "_read_line", side_effect=["1", card_number]), mock.patch("builtins.print"):
+                    _, action_data = handler.get_combat_action(self.player, [self.target_ailment])
+                self.assertEqual(action_data["target_index"], expected_target)
+
     def test_harmonic_pulse(self):
         """Test Harmonic Pulse heals all active tools."""
         card = HarmonicPulse()
@@ -190,8 +159,8 @@ class TestCardEffects(unittest.TestCase):
         # Reset resonance and damage both tools
         tool1.current_resonance = tool1.max_resonance
         tool2.current_resonance = tool2.max_resonance
-        tool1.take_damage(10, self.game_state.renderer)
-        tool2.take_damage(15, self.game_state.renderer)
+        tool1.current_resonance -= 10
+        tool2.current_resonance -= 15
         initial_res1 = tool1.current_resonance
         initial_res2 = tool2.current_resonance
 
@@ -201,40 +170,125 @@ class TestCardEffects(unittest.TestCase):
         expected_res1 = min(initial_res1 + card.resonance_amount, tool1.max_resonance)
         expected_res2 = min(initial_res2 + card.resonance_amount, tool2.max_resonance)
 
-        self.assertEqual(tool1.current_resonance, expected_res1)
-        self.assertEqual(tool1.current_resonance, expected_res1)
-        self.assertEqual(tool2.current_resonance, expected_res2)
-
-    def test_enhance_strike(self):
-        """Test enhancing a Strike card."""
-        card = Strike()
-        initial_name = card.name
-        initial_soothe = card.soothe_amount
-        enhanced = card.enhance(self.game_state.renderer)
-        self.assertTrue(enhanced)
-        self.assertEqual(card.name, initial_name + "+")
-        self.assertEqual(card.soothe_amount, initial_soothe + 2)
-        # Test enhancing again fails
-        enhanced_again = card.enhance(self.game_state.renderer)
-        self.assertFalse(enhanced_again)
-        self.assertEqual(card.soothe_amount, initial_soothe + 2) # Amount shouldn't change
-
-    def test_enhance_mend(self):
-        """Test enhancing a Mend card."""
-        card = Mend()
-        initial_name = card.name
-        initial_resonance = card.resonance_amount
-        enhanced = card.enhance(self.game_state.renderer)
-        self.assertTrue(enhanced)
-        self.assertEqual(card.name, initial_name + "+")
-        self.assertEqual(card.resonance_amount, initial_resonance + 2)
-        # Test enhancing again fails
-        enhanced_again = card.enhance(self.game_state.renderer)
-        self.assertFalse(enhanced_again)
-        self.assertEqual(card.resonance_amount, initial_resonance + 2) # Amount shouldn't change
+        self.assertEqual([tool1.current_resonance, tool2.current_resonance], [expected_res1, expected_res2])
+
+    def test_enhance(self):
+        """Test enhancing Strike and Mend raises their amount once and renames them."""
+        for card_cls, attr in ((Strike, "soothe_amount"), (Mend, "resonance_amount")):
+            with self.subTest(card=card_cls.__name__):
+                card = card_cls()
+                initial_name = card.name
+                initial_amount = getattr(card, attr)
+                enhanced = card.enhance(self.game_state.renderer)
+                self.assertTrue(enhanced)
+                self.assertEqual(card.name, initial_name + "+")
+                self.assertEqual(getattr(card, attr), initial_amount + 2)
+                # Test enhancing again fails
+                enhanced_again = card.enhance(self.game_state.renderer)
+                self.assertFalse(enhanced_again)
+                self.assertEqual(getattr(card, attr), initial_amount + 2) # Amount shouldn't change
+
+    def test_enhanced_copy_leaves_shared_card(self):
+        """Test enhancing a shared basic card copies it instead of upgrading every deck."""
+        shared = self.player.card_collection[0]
+        self.assertIs(shared, STRIKE)
+        enhanced = shared.enhanced_copy(self.game_state.renderer)
+        self.assertIsNot(enhanced, STRIKE)
+        self.assertEqual(enhanced.name, "Strike+")
+        self.assertEqual(enhanced.soothe_amount, STRIKE.soothe_amount + 2)
+        self.assertEqual(STRIKE.name, "Strike") # Shared instance untouched
+        self.assertIsNone(enhanced.enhanced_copy(self.game_state.renderer))
+
+    def test_enhance_card_updates_enhanceable_index(self):
+        """Test the player's enhanceable index tracks added and enhanced cards."""
+        initial_count = len(self.player.enhanceable_cards)
+        enhanced = self.player.enhance_card(STRIKE, self.game_state.renderer)
+        self.assertIn(enhanced, self.player.card_collection)
+        self.assertEqual(len(self.player.enhanceable_cards), initial_count - 1)
+        self.assertNotIn(enhanced, self.player.enhanceable_cards)
+        self.player.add_card(enhanced) # Already enhanced, so not indexed
+        self.player.add_card(Mend())
+        self.assertEqual(len(self.player.enhanceable_cards), initial_count)
+
+    def test_cards_are_slotted(self):
+        """Test Card and every subclass declare their own __slots__, so no card instance carries a __dict__."""
+        pending, card_classes = [Card], []
+        while pending: # Walk the whole subclass tree, not just direct subclasses
+            card_cls = pending.pop()
+            card_classes.append(card_cls)
+            pending.extend(card_cls.__subclasses__())
+        for card_cls in card_classes:
+            with self.subTest(card=card_cls.__name__):
+                self.assertIn("__slots__", vars(card_cls))
+
+    def test_card_types(self):
+        """Test cards carry CardType members that still display by name."""
+        self.assertEqual(Strike().card_type, CardType.MELODY)
+        self.assertEqual(Mend().card_type, CardType.HARMONY)
+        self.assertEqual(SteadyRhythm().card_type, CardType.RHYTHM)
+        self.assertEqual(str(Strike()), "Strike (Melody, Cost: 1) - Deal 4 Soothe.")
+
+    def test_ailment_intent_display(self):
+        """Test ailment intents are IntentAction members that display by name."""
+        self.target_ailment.determine_intent(self.player.tools, self.game_state)
+        self.assertIs(self.target_ailment.intent_action, IntentAction.ATTACK)
+        self.assertIn("Intent: Attack", str(self.target_ailment))
+
+    def test_ailment_act_reports_broken_tool(self):
+        """Test act returns True only when its attack breaks the targeted Tool."""
+        self.target_ailment.determine_intent(self.player.tools, self.game_state)
+        self.assertFalse(self.target_ailment.act(self.player, self.game_state))
+        target = self.player.tools[0]
+        target.current_resonance = 1
+        self.target_ailment.determine_intent([target], self.game_state)
+        self.assertTrue(self.target_ailment.act(self.player, self.game_state))
+        self.assertEqual(target.current_resonance, 0)
+
+    def test_strike_with_null_renderer(self):
+        """Test card effects still resolve when the renderer is disabled."""
+        self.game_state.renderer = NullRenderer()
+        strike = Strike()
+        initial_resonance = self.target_ailment.current_resonance
+        strike.execute(self.player, self.target_ailment, self.game_state)
+        self.assertEqual(self.target_ailment.current_resonance, initial_resonance - strike.soothe_amount)
+
+    def test_lyras_insight_with_null_renderer(self):
+        """Test card paths that draw cards still work when the renderer is disabled."""
+        self.game_state.renderer = NullRenderer()
+        self.player.deck = [STRIKE, STRIKE]
+        LyrasInsight().execute(self.player, None, self.game_state)
+        self.assertEqual(len(self.player.hand), 1)
 
 
     # TODO: Add tests for EntanglingTune
 
+class TestLyraCardEffects(unittest.TestCase):
+    """Cards that need Lyra's kit; built directly instead of replacing the Kaelen setUp of TestCardEffects."""
+
+    def setUp(self):
+        self.game_state = MockGameState()
+        self.player = PlayerCharacter(**get_lyra_data())
+        self.game_state.player_character = self.player
+        self.target_tool = self.player.tools[0]
+        # Ensure deck has cards
+        self.player.deck = [STRIKE] * 3 # Add dummy cards
+
+    def test_lyras_insight_no_buff(self):
+        """Test Lyra's Insight draws 1 card when no tool has buffs."""
+        self.target_tool.clear_status_effects() # Ensure no buffs
+        card = LyrasInsight()
+        initial_hand_size = len(self.player.hand)
+        card.execute(self.player, None, self.game_state)
+        self.assertEqual(len(self.player.hand), initial_hand_size + 1) # Drew 1 card
+
+    def test_lyras_insight_with_buff(self):
+        """Test Lyra's Insight draws 2 cards when a tool has buffs."""
+        # Give tool a buff
+        self.target_tool.add_status_effect("Guard", 1, self.game_state.renderer)
+        card = LyrasInsight()
+        initial_hand_size = len(self.player.hand)
+        card.execute(self.player, None, self.game_state)
+        self.assertEqual(len(self.player.hand), initial_hand_size + 2) # Drew 2 cards
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,52 +1,43 @@
 import unittest
-import sys
-import os
 
-# Add project root to sys.path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-
-from chromatic_glitch.dice import DiceGame, Die, ObsidianFocusDie, RiverPearlDie, calculate_score
+from chromatic_glitch.dice import DiceGame, Die
 from chromatic_glitch.characters import PlayerCharacter, get_kaelen_data
 from tests.mocks import MockRenderer, MockInputHandler
-import random # Import random module
-
-# Mock random.randint to control dice rolls
-original_randint = random.randint
-def controlled_randint(a, b):
-    """Return predefined rolls or default."""
-    if controlled_randint.rolls:
-        return controlled_randint.rolls.pop(0)
-    return original_randint(a, b) # Fallback if needed
-controlled_randint.rolls = []
+from collections import deque
+from unittest import mock
 
-import random
-random.randint = controlled_randint
+def _combo(combo, score, desc):
+    """Set-aside action data for a known combo; the same entry calculate_score would offer (see test_dice_scoring)."""
+    return {"combo": combo, "score": score, "desc": desc}
 
 class TestDiceGameFlow(unittest.TestCase):
 
     def setUp(self):
         self.player = PlayerCharacter(**get_kaelen_data())
+        # Plain dice, so leftover 2s and 3s end the selection instead of forcing the Obsidian Focus re-roll
+        self.player.dice_loadout = [Die("Standard") for _ in range(6)]
         self.renderer = MockRenderer()
         self.input_handler = MockInputHandler()
-        # Reset rolls before each test
-        controlled_randint.rolls = []
-
-    def tearDown(self):
-        # Restore original randint after tests
-        random.randint = original_randint
+        # Predefined rolls, consumed in order by both roll paths (batched d6s and single Die.roll)
+        self.rolls = deque()
+        # Patched per test and undone by cleanup, so no other test module sees a rigged RNG
+        for name, side_effect in (("randint", lambda a, b: self.rolls.popleft()),
+                                  ("choices", lambda faces, k: [self.rolls.popleft() for _ in range(k)])):
+            patcher = mock.patch(f"chromatic_glitch.dice.random.{name}", side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
     def test_bust_on_first_roll(self):
         """Test busting immediately."""
-        controlled_randint.rolls = [2, 3, 4, 6, 2, 4] # No scoring dice
+        self.rolls.extend([2, 3, 4, 6, 2, 4]) # No scoring dice
         dice_game = DiceGame(self.player)
         round_score = dice_game._play_round(self.renderer, self.input_handler)
         self.assertEqual(round_score, 0)
-        self.assertIn("No scoring dice! Busted this round.", "".join(self.renderer.messages))
+        self.assertTrue(self.renderer.contains("No scoring dice available in this roll."))
 
     def test_score_singles_and_stop(self):
         """Test scoring 1 and 5 then stopping."""
-        controlled_randint.rolls = [1, 5, 2, 2, 3, 6] # Roll 1, 5, and non-scorers (avoiding straight)
+        self.rolls.extend([1, 5, 2, 2, 3, 6]) # Roll 1, 5, and non-scorers (avoiding straight)
         dice_game = DiceGame(self.player)
 
         # Preset inputs:
@@ -57,13 +48,8 @@ class TestDiceGameFlow(unittest.TestCase):
         # Note: This relies heavily on the order presented by the mock input handler's get_dice_to_set_aside
         # A more robust mock might be needed for complex scenarios.
         # Let's assume the mock returns the first valid score if multiple exist.
-        possible_scores_roll1 = calculate_score([1, 5, 2, 2, 3, 6])
-        score_1_data = next(d for d in possible_scores_roll1 if d[0] == (1,))
-        self.input_handler.add_dice_action("set_aside", {"combo": score_1_data[0], "score": score_1_data[1], "desc": score_1_data[2]})
-
-        possible_scores_roll2 = calculate_score([5, 2, 2, 3, 6]) # After setting aside 1
-        score_5_data = next(d for d in possible_scores_roll2 if d[0] == (5,))
-        self.input_handler.add_dice_action("set_aside", {"combo": score_5_data[0], "score": score_5_data[1], "desc": score_5_data[2]})
+        self.input_handler.add_dice_action("set_aside", _combo((1,), 100, 'Single 1'))
+        self.input_handler.add_dice_action("set_aside", _combo((5,), 50, 'Single 5'))
 
         self.input_handler.add_dice_action("stop") # Choose 'd'
         self.input_handler.add_reroll_choice(False) # Choose 'n'
@@ -73,7 +59,7 @@ class TestDiceGameFlow(unittest.TestCase):
 
     def test_score_triple_roll_again_bust(self):
         """Test scoring a triple, rolling again, then busting."""
-        controlled_randint.rolls = [4, 4, 4, 2, 3, 6] + [2, 3, 6] # Roll 1 + Roll 2 (bust)
+        self.rolls.extend([4, 4, 4, 2, 3, 6] + [2, 3, 6]) # Roll 1 + Roll 2 (bust)
         dice_game = DiceGame(self.player)
 
         # Preset inputs:
@@ -81,16 +67,14 @@ class TestDiceGameFlow(unittest.TestCase):
         # 2. Choose action: Done ('d')
         # 3. Choose roll again? Yes ('y')
         # (Next roll is [2, 3, 6] -> Bust)
-        possible_scores_roll1 = calculate_score([4, 4, 4, 2, 3, 6])
-        score_444_data = next(d for d in possible_scores_roll1 if d[0] == (4, 4, 4))
-        self.input_handler.add_dice_action("set_aside", {"combo": score_444_data[0], "score": score_444_data[1], "desc": score_444_data[2]})
+        self.input_handler.add_dice_action("set_aside", _combo((4, 4, 4), 400, 'Triple 4s'))
         self.input_handler.add_dice_action("stop")
         self.input_handler.add_reroll_choice(True) # Roll again
 
         round_score = dice_game._play_round(self.renderer, self.input_handler)
         # Even though 400 was scored initially, the bust on the second roll zeroes the round
         self.assertEqual(round_score, 0)
-        self.assertIn("No scoring dice! Busted this round.", "".join(self.renderer.messages))
+        self.assertTrue(self.renderer.contains("No scoring dice available in this roll."))
 
     # TODO: Add tests for Hot Dice
     # TODO: Add tests for Obsidian Focus Die reroll interaction
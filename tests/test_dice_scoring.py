@@ -1,13 +1,17 @@
 import unittest
-import sys
-import os
-
-# Add project root to sys.path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
 
 from chromatic_glitch.dice import calculate_score, Die, RiverPearlDie
 
+# (roll, combos that must be among its scores); one table instead of a near-identical method per combo
+SCORING_CASES = [
+    ([1, 2, 3, 4, 6, 2], [((1,), 100, 'Single 1')]),
+    ([5, 2, 3, 4, 6, 2], [((5,), 50, 'Single 5')]),
+    ([2, 2, 2, 3, 4, 6], [((2, 2, 2), 200, 'Triple 2s')]),
+    ([1, 1, 1, 3, 4, 6], [((1, 1, 1), 1000, 'Triple 1s')]),
+    ([3, 3, 3, 1, 4, 6], [((3, 3, 3), 300, 'Triple 3s'), ((1,), 100, 'Single 1')]),
+    ([4, 4, 4, 6, 6, 6], [((4, 4, 4), 400, 'Triple 4s'), ((6, 6, 6), 600, 'Triple 6s')]),
+]
+
 class TestDiceScoring(unittest.TestCase):
 
     def test_no_score(self):
@@ -15,15 +19,13 @@ class TestDiceScoring(unittest.TestCase):
         scores = calculate_score([2, 3, 4, 6, 2, 4])
         self.assertEqual(scores, [])
 
-    def test_single_1(self):
-        """Test single 1 scoring."""
-        scores = calculate_score([1, 2, 3, 4, 6, 2])
-        self.assertIn(((1,), 100, 'Single 1'), scores)
-
-    def test_single_5(self):
-        """Test single 5 scoring."""
-        scores = calculate_score([5, 2, 3, 4, 6, 2])
-        self.assertIn(((5,), 50, 'Single 5'), scores)
+    def test_expected_combos_present(self):
+        """Test each roll's scores include every expected combo."""
+        for roll, expected_combos in SCORING_CASES:
+            scores = calculate_score(roll)
+            for combo in expected_combos:
+                with self.subTest(roll=roll, combo=combo):
+                    self.assertIn(combo, scores)
 
     def test_multiple_singles(self):
         """Test multiple single 1s and 5s."""
@@ -31,30 +33,12 @@ class TestDiceScoring(unittest.TestCase):
         # Note: Current implementation returns separate entries for each single
         self.assertTrue(any(s == ((1,), 100, 'Single 1') for s in scores))
         self.assertTrue(any(s == ((5,), 50, 'Single 5') for s in scores))
-        # Check count if implementation changes later
-        # self.assertEqual(sum(1 for s in scores if s[0] == (1,)), 2)
-
-    def test_triple_2s(self):
-        """Test triple 2s scoring."""
-        scores = calculate_score([2, 2, 2, 3, 4, 6])
-        self.assertIn(((2, 2, 2), 200, 'Triple 2s'), scores)
+        self.assertEqual(sum(1 for s in scores if s[0] == (1,)), 2)
 
-    def test_triple_1s(self):
-        """Test triple 1s scoring."""
-        scores = calculate_score([1, 1, 1, 3, 4, 6])
-        self.assertIn(((1, 1, 1), 1000, 'Triple 1s'), scores)
-
-    def test_triple_and_single(self):
-        """Test triple and single scoring together."""
-        scores = calculate_score([3, 3, 3, 1, 4, 6])
-        self.assertTrue(any(s == ((3, 3, 3), 300, 'Triple 3s') for s in scores))
-        self.assertTrue(any(s == ((1,), 100, 'Single 1') for s in scores))
-
-    def test_two_triples(self):
-        """Test two triples scoring."""
-        scores = calculate_score([4, 4, 4, 6, 6, 6])
-        self.assertTrue(any(s == ((4, 4, 4), 400, 'Triple 4s') for s in scores))
-        self.assertTrue(any(s == ((6, 6, 6), 600, 'Triple 6s') for s in scores))
+    def test_triple_with_extra_singles(self):
+        """Test dice beyond a triple still score as singles."""
+        scores = calculate_score([1, 1, 1, 1, 5, 2])
+        self.assertEqual(scores, [((1, 1, 1), 1000, 'Triple 1s'), ((1,), 100, 'Single 1'), ((5,), 50, 'Single 5')])
 
     def test_straight(self):
         """Test straight 1-6 scoring."""
@@ -70,6 +54,11 @@ class TestDiceScoring(unittest.TestCase):
         # Check if the standard 5 score is NOT present
         self.assertFalse(any(s == ((5,), 50, 'Single 5') for s in scores))
 
+    def test_river_pearl_flag(self):
+        """Test the cached River Pearl flag scores 5s like passing the die objects."""
+        scores = calculate_score([5, 2, 3, 4, 6, 2], river_pearl=True)
+        self.assertEqual(scores, [((5,), 60, 'Single 5 (River Pearl)')])
+
     def test_river_pearl_triple_5(self):
         """Test River Pearl Die effect with triple 5s (should still be base triple score)."""
         dice_objects = [RiverPearlDie(), RiverPearlDie(), RiverPearlDie(), Die("Standard"), Die("Standard"), Die("Standard")]
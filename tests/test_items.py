@@ -1,14 +1,8 @@
 import unittest
-import sys
-import os
-
-# Add project root to sys.path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
 
 from chromatic_glitch.items import ResonatorCrystal, SoothingPoultice
 from chromatic_glitch.characters import PlayerCharacter, get_kaelen_data
-from tests.mocks import MockRenderer, MockGameState
+from tests.mocks import MockGameState
 
 class TestItemEffects(unittest.TestCase):
 
@@ -16,9 +10,6 @@ class TestItemEffects(unittest.TestCase):
         self.game_state = MockGameState()
         self.player = PlayerCharacter(**get_kaelen_data())
         self.game_state.player_character = self.player
-        # Ensure dice_score_bonus doesn't exist initially
-        if hasattr(self.player, 'dice_score_bonus'):
-            delattr(self.player, 'dice_score_bonus')
 
     def test_resonator_crystal_equip_unequip(self):
         """Test equipping and unequipping Resonator Crystal applies/removes bonus."""
@@ -26,21 +17,20 @@ class TestItemEffects(unittest.TestCase):
         renderer = self.game_state.renderer
 
         # Check initial state
-        self.assertFalse(hasattr(self.player, 'dice_score_bonus') or getattr(self.player, 'dice_score_bonus', 0) != 0)
+        self.assertEqual(self.player.dice_score_bonus, 0)
 
         # Equip - Slot 0
         equipped = self.player.equip_item(item, 0, renderer)
         self.assertTrue(equipped)
-        self.assertTrue(hasattr(self.player, 'dice_score_bonus'))
         self.assertEqual(self.player.dice_score_bonus, 50)
-        self.assertIn("Equipped Resonator Crystal", "".join(renderer.messages)) # Check message
+        self.assertTrue(renderer.contains("Equipped Resonator Crystal")) # Check message
 
         # Unequip
         unequipped = self.player.unequip_item(0, renderer)
         self.assertTrue(unequipped)
         # Check bonus is removed or reset (assuming 0 if removed)
-        self.assertEqual(getattr(self.player, 'dice_score_bonus', 0), 0)
-        self.assertIn("Unequipped Resonator Crystal", "".join(renderer.messages)) # Check message
+        self.assertEqual(self.player.dice_score_bonus, 0)
+        self.assertTrue(renderer.contains("Unequipped Resonator Crystal")) # Check message
 
     def test_soothing_poultice_heal(self):
         """Test Soothing Poultice heals the most damaged tool."""
@@ -49,9 +39,9 @@ class TestItemEffects(unittest.TestCase):
         tool1 = self.player.tools[0]
         tool2 = self.player.tools[1]
 
-        # Damage tools unequally
-        tool1.take_damage(20, renderer) # More damaged
-        tool2.take_damage(10, renderer)
+        # Damage tools unequally so the poultice has to pick tool1
+        tool1.current_resonance -= 20 # More damaged
+        tool2.current_resonance -= 10
         initial_res1 = tool1.current_resonance
         initial_res2 = tool2.current_resonance
 
@@ -63,5 +53,14 @@ class TestItemEffects(unittest.TestCase):
         self.assertEqual(tool1.current_resonance, min(initial_res1 + 15, tool1.max_resonance))
         self.assertEqual(tool2.current_resonance, initial_res2) # Tool 2 should be unchanged
 
+    def test_add_consumable_keeps_one_object_per_name(self):
+        """Test repeated consumables share one collection entry found by name."""
+        first = SoothingPoultice()
+        self.player.add_consumable(first)
+        self.player.add_consumable(SoothingPoultice())
+        self.assertEqual(self.player.consumables[first.name], 2)
+        self.assertEqual(self.player.item_collection, [first])
+        self.assertIs(self.player.item_by_name[first.name], first)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,23 +1,16 @@
 import unittest
-import sys
-import os
 
-# Add project root to sys.path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-
-# Add project root to sys.path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-
-from chromatic_glitch.tools import Tool
 from chromatic_glitch.ailments import Ailment
 # Import cards needed for tests
-from chromatic_glitch.cards import FlowingChord, EntanglingTune, Guard, StutteringBeat, Strike
+# Cards only read their own attributes in execute, and drawing just moves them, so tests use the pooled shared instances (STRIKE fills dummy decks)
+from chromatic_glitch.cards import FlowingChord, EntanglingTune, Guard, StutteringBeat, STRIKE, card as shared_card
 # Import mock game state and player using absolute path
 from tests.mocks import MockGameState
 from chromatic_glitch.characters import PlayerCharacter, get_kaelen_data # Use real player for tool access
 
+# Soothe taken from a base of 10 under each Fragile tier (+50% per stack)
+FRAGILE_EXPECTED_SOOTHE = {"Fragile_1": 15, "Fragile_2": 20}
+
 class TestStatusEffects(unittest.TestCase):
 
     def setUp(self):
@@ -28,23 +21,24 @@ class TestStatusEffects(unittest.TestCase):
         # Reset tool/ailment state for each test
         self.tool = self.player.tools[0]
         self.tool.current_resonance = self.tool.max_resonance
-        self.tool.status_effects = {}
+        self.tool.clear_status_effects()
         self.ailment = Ailment("Test Ailment", 30)
-        self.ailment.status_effects = {}
+        self.ailment.clear_status_effects()
 
 
     def test_entangling_tune_application(self): # Keep this as it tests Slow application
         """Test Entangling Tune applies Slow status."""
-        card = EntanglingTune()
+        card = shared_card(EntanglingTune)
         self.assertNotIn("Slow_1", self.ailment.status_effects)
         # Pass game_state to execute
         card.execute(self.player, self.ailment, self.game_state)
         self.assertIn("Slow_1", self.ailment.status_effects)
         self.assertEqual(self.ailment.status_effects["Slow_1"], card.status_effect_duration)
+        self.assertEqual(self.ailment.slow_stacks, 1)
 
     def test_stuttering_beat_applies_both(self):
         """Test Stuttering Beat applies Slow and Fragile."""
-        card = StutteringBeat() # Need to import this card
+        card = shared_card(StutteringBeat) # Need to import this card
         self.assertNotIn("Slow_1", self.ailment.status_effects)
         self.assertNotIn("Fragile_1", self.ailment.status_effects)
         card.execute(self.player, self.ailment, self.game_state)
@@ -55,14 +49,14 @@ class TestStatusEffects(unittest.TestCase):
 
     def test_stuttering_beat_draws_if_slowed(self):
         """Test Stuttering Beat draws a card if target is already Slowed."""
-        card = StutteringBeat()
+        card = shared_card(StutteringBeat)
         # Apply Slow first
         self.ailment.add_status_effect("Slow_1", 1, self.game_state.renderer)
         self.assertIn("Slow_1", self.ailment.status_effects)
 
         initial_hand_size = len(self.player.hand)
         # Ensure deck has cards
-        self.player.deck = [Strike(), Strike()] # Add dummy cards
+        self.player.deck = [STRIKE, STRIKE] # Add dummy cards
 
         card.execute(self.player, self.ailment, self.game_state)
         # Check Fragile was applied
@@ -71,21 +65,45 @@ class TestStatusEffects(unittest.TestCase):
         self.assertEqual(len(self.player.hand), initial_hand_size + 1)
 
     def test_fragile_increases_soothe(self):
-        """Test Fragile status increases Soothe damage taken."""
-        # Apply Fragile_1
+        """Test each Fragile tier increases Soothe damage taken by 50% per stack."""
+        base_soothe = 10
+        for status_key, expected_soothe in FRAGILE_EXPECTED_SOOTHE.items():
+            with self.subTest(status=status_key):
+                ailment = Ailment("Test Ailment", 30) # Fresh per tier so stacks don't add up
+                ailment.add_status_effect(status_key, 1, self.game_state.renderer)
+                initial_resonance = ailment.current_resonance
+
+                # Apply soothe
+                ailment.take_soothe(base_soothe, self.game_state.renderer)
+                self.assertEqual(ailment.current_resonance, initial_resonance - expected_soothe)
+
+    def test_fragile_expires(self):
+        """Test Soothe is no longer increased once Fragile has ticked away."""
         self.ailment.add_status_effect("Fragile_1", 1, self.game_state.renderer)
+        self.ailment.tick_status_effects(self.game_state.renderer)
+        self.assertEqual(self.ailment.fragile_stacks, 0)
         initial_resonance = self.ailment.current_resonance
-        base_soothe = 10
-        expected_soothe = int(base_soothe * 1.5) # 50% increase for Fragile_1
 
-        # Apply soothe
-        self.ailment.take_soothe(base_soothe, self.game_state.renderer)
-        self.assertEqual(self.ailment.current_resonance, initial_resonance - expected_soothe)
+        self.ailment.take_soothe(10, self.game_state.renderer)
+        self.assertEqual(self.ailment.current_resonance, initial_resonance - 10)
 
+    def test_fragile_refresh_does_not_stack(self):
+        """Test re-applying an active Fragile refreshes it without adding stacks."""
+        self.ailment.add_status_effect("Fragile_1", 1, self.game_state.renderer)
+        self.ailment.add_status_effect("Fragile_1", 2, self.game_state.renderer)
+        self.assertEqual(self.ailment.fragile_stacks, 1)
+        self.assertEqual(self.ailment.status_effects["Fragile_1"], 2)
+
+    def test_clear_status_effects_resets_fragile(self):
+        """Test clearing an ailment's effects also resets its Fragile stacks."""
+        self.ailment.add_status_effect("Fragile_2", 2, self.game_state.renderer)
+        self.ailment.clear_status_effects()
+        self.assertEqual(self.ailment.status_effects, {})
+        self.assertEqual(self.ailment.fragile_stacks, 0)
 
     def test_resonance_application(self):
         """Test Flowing Chord applies Resonance status."""
-        card = FlowingChord()
+        card = shared_card(FlowingChord)
         self.assertNotIn("Resonance_2", self.tool.status_effects)
         # Pass game_state to execute
         card.execute(self.player, self.tool, self.game_state)
@@ -94,7 +112,7 @@ class TestStatusEffects(unittest.TestCase):
 
     def test_resonance_ticking_heal(self):
         """Test Resonance status effect heals over time."""
-        card = FlowingChord()
+        card = shared_card(FlowingChord)
         # Pass game_state to execute
         card.execute(self.player, self.tool, self.game_state) # Apply Resonance_2
 
@@ -113,28 +131,17 @@ class TestStatusEffects(unittest.TestCase):
         self.assertEqual(self.tool.current_resonance, initial_resonance + card.status_effect_value) # Healed by 2
         self.assertNotIn("Resonance_2", self.tool.status_effects) # Effect expired
 
-    def test_slow_application(self):
-        """Test Entangling Tune applies Slow status."""
-        card = EntanglingTune()
-        self.assertNotIn("Slow_1", self.ailment.status_effects)
-        # Pass game_state to execute
-        card.execute(self.player, self.ailment, self.game_state)
-        self.assertIn("Slow_1", self.ailment.status_effects)
-        self.assertEqual(self.ailment.status_effects["Slow_1"], card.status_effect_duration)
-
-    def test_slow_ticking(self):
-        """Test Slow status effect ticks down."""
-        card = EntanglingTune()
-        # Pass game_state to execute
-        card.execute(self.player, self.ailment, self.game_state) # Apply Slow_1
-
-        # Tick 1 (needs renderer)
-        self.ailment.tick_status_effects(self.game_state.renderer)
-        self.assertNotIn("Slow_1", self.ailment.status_effects) # Effect expired after 1 tick
+    def test_slow_refresh_and_clear(self):
+        """Test re-applying Slow keeps one stack and clearing effects resets it."""
+        self.ailment.add_status_effect("Slow_1", 1, self.game_state.renderer)
+        self.ailment.add_status_effect("Slow_1", 2, self.game_state.renderer)
+        self.assertEqual(self.ailment.slow_stacks, 1)
+        self.ailment.clear_status_effects()
+        self.assertEqual(self.ailment.slow_stacks, 0)
 
     def test_guard_application(self):
         """Test Guard card applies Guard status."""
-        card = Guard()
+        card = shared_card(Guard)
         self.assertNotIn("Guard", self.tool.status_effects)
         # Pass game_state to execute
         card.execute(self.player, self.tool, self.game_state)
@@ -143,7 +150,7 @@ class TestStatusEffects(unittest.TestCase):
 
     def test_guard_blocking(self):
         """Test Guard status blocks damage and is consumed."""
-        card = Guard()
+        card = shared_card(Guard)
         # Pass game_state to execute
         card.execute(self.player, self.tool, self.game_state) # Apply Guard
         initial_resonance = self.tool.current_resonance
@@ -156,16 +163,41 @@ class TestStatusEffects(unittest.TestCase):
         self.assertEqual(self.tool.current_resonance, initial_resonance)
         self.assertNotIn("Guard", self.tool.status_effects)
 
-    def test_guard_ticking(self):
-        """Test Guard status expires after ticking."""
-        card = Guard()
-        # Pass game_state to execute
-        card.execute(self.player, self.tool, self.game_state) # Apply Guard
-        self.assertIn("Guard", self.tool.status_effects)
+    def test_effects_expire_after_ticking(self):
+        """Test one-turn effects applied by cards are gone after a single tick."""
+        for card_cls, target_attr, status_key in ((EntanglingTune, "ailment", "Slow_1"), (Guard, "tool", "Guard")):
+            with self.subTest(status=status_key):
+                target = getattr(self, target_attr)
+                # Pass game_state to execute
+                shared_card(card_cls).execute(self.player, target, self.game_state)
+                self.assertIn(status_key, target.status_effects)
+
+                # Tick 1 (needs renderer)
+                target.tick_status_effects(self.game_state.renderer)
+                self.assertNotIn(status_key, target.status_effects) # Should expire
+        self.assertEqual(self.ailment.slow_stacks, 0) # The cached Slow counter follows the expiry
+
+    def test_positive_count_guard_consumed(self):
+        """Test a Guard consumed by take_damage drops the tool's positive effect count."""
+        self.tool.add_status_effect("Guard", 1, self.game_state.renderer)
+        self.assertEqual(self.tool.positive_effect_count, 1)
+        self.tool.take_damage(10, self.game_state.renderer)
+        self.assertEqual(self.tool.positive_effect_count, 0)
 
-        # Tick 1 (needs renderer)
+    def test_positive_count_resonance_expires(self):
+        """Test an expiring Resonance effect drops the tool's positive effect count."""
+        self.tool.add_status_effect("Resonance_2", 1, self.game_state.renderer)
+        self.assertEqual(self.tool.positive_effect_count, 1)
         self.tool.tick_status_effects(self.game_state.renderer)
-        self.assertNotIn("Guard", self.tool.status_effects) # Should expire
+        self.assertEqual(self.tool.positive_effect_count, 0)
+
+    def test_positive_count_refresh_does_not_double_count(self):
+        """Test re-applying an active buff or clearing effects keeps the count accurate."""
+        self.tool.add_status_effect("Guard", 1, self.game_state.renderer)
+        self.tool.add_status_effect("Guard", 2, self.game_state.renderer)
+        self.assertEqual(self.tool.positive_effect_count, 1)
+        self.tool.clear_status_effects()
+        self.assertEqual(self.tool.positive_effect_count, 0)
 
 if __name__ == '__main__':
     unittest.main()